@@ -14,7 +14,7 @@ from transientbvd.activation import activation_current, activation_4tau
 
 
 def plot_activation_current(
-    timestamps: list[float],
+    timestamps: np.ndarray,
     transducer,
     ucw: float,
     ub: float | None = None,
@@ -33,7 +33,7 @@ def plot_activation_current(
 
     Parameters
     ----------
-    timestamps : list[float]
+    timestamps : np.ndarray
         Time points (seconds) for evaluating the current.
     transducer : Transducer
         The transducer object containing the equivalent circuit parameters.
@@ -46,30 +46,28 @@ def plot_activation_current(
         can be calculated internally by `switching_time`.
     """
     # 1) Evaluate currents for the overboost approach (if ub is given) or default approach
-    currents_overboost = [
-        activation_current(t, transducer, ucw, ub, t_sw) for t in timestamps
-    ]
+    currents_overboost = activation_current(timestamps, transducer, ucw, ub, t_sw)
 
     # 2) Plot results
-    plt.figure(figsize=(8, 5))
+    fig, ax = plt.subplots(figsize=(8, 5))
     label_overboost = (
         "Transient Current using overboost"
         if ub is not None
         else "Transient Current (No Overboost)"
     )
-    plt.plot(timestamps, currents_overboost, label=label_overboost, color="b")
+    ax.plot(timestamps, currents_overboost, label=label_overboost, color="b")
 
     # 3) Add the steady-state current reference
     steady_state_current = ucw / transducer.rs
-    plt.axhline(
+    ax.axhline(
         y=steady_state_current, color="r", linestyle="--", label="Steady-State Current"
     )
 
     # 4) If ub is specified, also plot the scenario without any overboost
     if ub is not None:
         # Currents if only UCW is applied from t=0
-        currents_no_boost = [activation_current(t, transducer, ucw) for t in timestamps]
-        plt.plot(
+        currents_no_boost = activation_current(timestamps, transducer, ucw)
+        ax.plot(
             timestamps,
             currents_no_boost,
             label="Transient Current (Only U_cw)",
@@ -79,28 +77,34 @@ def plot_activation_current(
 
     # 5) Plot the 4τ time for the overboost approach (or single approach if no ub)
     t_4tau_overboost = activation_4tau(transducer, ucw, ub, t_sw)
-    plt.axvline(
+    ax.axvline(
         x=t_4tau_overboost, color="black", linestyle="--", label="4τ (Overboost)"
     )
 
     # 6) If ub is specified, also show the 4τ time for no overboost
     if ub is not None:
         t_4tau_no_boost = activation_4tau(transducer, ucw)
-        plt.axvline(
+        ax.axvline(
             x=t_4tau_no_boost, color="g", linestyle="dashed", label="4τ (Only U_cw)"
         )
 
     # 7) If switching time is given, visualize it
     if t_sw is not None:
-        plt.axvline(x=t_sw, color="black", linestyle="solid", label="Switching Time")
+        ax.axvline(x=t_sw, color="black", linestyle="solid", label="Switching Time")
 
     # 8) Final plot formatting
-    plt.xlabel("Time (s)")
-    plt.ylabel("Current (A)")
-    plt.title("Activation Transient Current Response Example")
-    plt.legend()
-    plt.grid()
-    plt.show()
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Current (A)")
+    ax.set_title("Activation Transient Current Response Example")
+    ax.legend()
+    ax.grid()
+
+    # Show interactively, or save to a file when running headless (e.g. MPLBACKEND=Agg)
+    if plt.get_backend().lower() == "agg":
+        fig.savefig("activation_current.png")
+        print("Plot saved to activation_current.png")
+    else:
+        plt.show()
 
 
 def main():
@@ -117,7 +121,7 @@ def main():
     ub = 60.0
 
     # Example timestamps
-    timestamps = np.linspace(0, 0.020, 10000).tolist()
+    timestamps = np.linspace(0, 0.020, 10000)
 
     # Optional switching time
     t_sw = 0.003  # 3 ms
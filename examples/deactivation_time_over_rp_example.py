@@ -1,6 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from transientbvd import select_transducer, deactivation_two_tau
+from transientbvd import select_transducer, deactivation_tau_batch
 
 # Step 1: Select a predefined transducer
 selected_name = "SMBLTD45F28H_28kHz"
@@ -8,19 +8,25 @@ transducer = select_transducer(selected_name)
 print(f"Selected Transducer:\n{transducer}\n")
 
 # Step 2: Define the range of resistance values
-rp_values = np.logspace(1, 4, 100)  # Logarithmic scale from 10 Ω to 10,000 Ω
+rp_values = np.geomspace(10, 10_000, 100)  # Logarithmic scale from 10 Ω to 10,000 Ω
 
-# Step 3: Calculate decay times for each resistance value
-decay_times = [deactivation_two_tau(transducer, rp) for rp in rp_values]
+# Step 3: Calculate decay times (2τ) for all resistance values in one call
+decay_times = 2 * deactivation_tau_batch(transducer, rp_values)
 
 # Step 4: Plot Decay Time vs Resistance
-plt.figure(figsize=(8, 6))
-plt.plot(rp_values, decay_times, label="Decay Time (2τ)", linewidth=2)
-plt.xscale("log")
-plt.yscale("log")
-plt.xlabel("Parallel Resistance (Rp) [Ω]")
-plt.ylabel("Decay Time (2τ) [s]")
-plt.title("Decay Time vs Parallel Resistance")
-plt.grid(True, which="both", linestyle="--", linewidth=0.5)
-plt.legend()
-plt.show()
+fig, ax = plt.subplots(figsize=(8, 6))
+ax.plot(rp_values, decay_times, label="Decay Time (2τ)", linewidth=2)
+ax.set_xscale("log")
+ax.set_yscale("log")
+ax.set_xlabel("Parallel Resistance (Rp) [Ω]")
+ax.set_ylabel("Decay Time (2τ) [s]")
+ax.set_title("Decay Time vs Parallel Resistance")
+ax.grid(True, which="both", linestyle="--", linewidth=0.5)
+ax.legend()
+
+# Show interactively, or save to a file when running headless (e.g. MPLBACKEND=Agg)
+if plt.get_backend().lower() == "agg":
+    fig.savefig("decay_time_over_rp.png")
+    print("Plot saved to decay_time_over_rp.png")
+else:
+    plt.show()
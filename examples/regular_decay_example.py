@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from transientbvd import select_transducer
 
@@ -11,8 +12,20 @@ transducer_info = {
     6: "SMBLTD45F28H_28kHz",
 }
 
-# Data storage for export
-data = []
+# Preallocated, typed storage for export (one row per transducer)
+data = np.empty(
+    len(transducer_info),
+    dtype=[
+        ("number", "i4"),
+        ("model", "U32"),
+        ("rs", "f8"),
+        ("ls", "f8"),
+        ("cs", "f8"),
+        ("c0", "f8"),
+        ("two_tau", "f8"),
+    ],
+)
+n_rows = 0
 
 # Process each transducer
 for number, name in transducer_info.items():
@@ -21,27 +34,35 @@ for number, name in transducer_info.items():
         transducer = select_transducer(name)
 
         # Calculate decay times without using Rp
-        tau_no_rp = 2 * transducer.ls / transducer.rs
+        tau_no_rp = transducer.tau_no_rp
         two_tau_no_rp = 2 * tau_no_rp
 
         # Store data for export
-        data.append(
-            {
-                "Transducer Number": number,
-                "Model": name,
-                "Rs (Ω)": transducer.rs,
-                "Ls (mH)": transducer.ls * 1e3,  # Convert H to mH
-                "Cs (pF)": transducer.cs * 1e12,  # Convert F to pF
-                "C0 (pF)": transducer.c0 * 1e12,  # Convert F to pF
-                "Two Tau (ms)": two_tau_no_rp * 1e3,  # Convert s to ms
-            }
+        data[n_rows] = (
+            number,
+            name,
+            transducer.rs,
+            transducer.ls * 1e3,  # Convert H to mH
+            transducer.cs * 1e12,  # Convert F to pF
+            transducer.c0 * 1e12,  # Convert F to pF
+            two_tau_no_rp * 1e3,  # Convert s to ms
         )
+        n_rows += 1
 
     except Exception as e:
         print(f"Error processing {name}: {e}")
 
 # Export data to CSV
-export_df = pd.DataFrame(data)
-export_df.to_csv("transducer_two_tau.csv", index=False)
+export_df = pd.DataFrame(data[:n_rows])
+export_df.columns = [
+    "Transducer Number",
+    "Model",
+    "Rs (Ω)",
+    "Ls (mH)",
+    "Cs (pF)",
+    "C0 (pF)",
+    "Two Tau (ms)",
+]
+export_df.to_csv("transducer_two_tau.csv", index=False, encoding="utf-8")
 
 print("Regular decay data exported to transducer_two_tau.csv")
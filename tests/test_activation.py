@@ -15,9 +15,10 @@ from transientbvd.transducer import Transducer
 class TestActivationCurrent(unittest.TestCase):
     """Tests for the activation_current function."""
 
-    def setUp(self):
-        """Setup a default transducer for testing."""
-        self.transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Setup a shared default transducer for testing."""
+        cls.transducer = Transducer(
             name="TestTransducer", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
         )
 
@@ -52,6 +53,44 @@ class TestActivationCurrent(unittest.TestCase):
         i_after = activation_current(t_after, self.transducer, ucw, ub, t_sw)
         self.assertGreater(i_after, 0.0)
 
+    def test_activation_current_array_matches_scalar(self):
+        """Array input should match scalar evaluation point by point."""
+        ucw = 30.0
+        ub = 45.0
+        t_sw = switching_time(self.transducer, ub, ucw)
+        timestamps = np.linspace(0.0, 0.01, 501)
+
+        for kwargs in ({}, {"ub": ub, "t_sw": t_sw}):
+            result = activation_current(timestamps, self.transducer, ucw, **kwargs)
+            expected = np.array(
+                [
+                    activation_current(float(t), self.transducer, ucw, **kwargs)
+                    for t in timestamps
+                ]
+            )
+            self.assertEqual(result.shape, timestamps.shape)
+            np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
+
+    def test_activation_current_array_with_inf(self):
+        """np.inf entries in an array should yield the steady-state current."""
+        timestamps = np.array([0.0, 1e-3, np.inf])
+        result = activation_current(timestamps, self.transducer, ucw=25)
+        self.assertAlmostEqual(result[-1], 25 / self.transducer.rs, places=7)
+        self.assertTrue(np.all(np.isfinite(result)))
+
+    def test_activation_current_small_time_precision(self):
+        """Right after switch-on the current follows (ucw/rs) * t/tau to full precision."""
+        ucw = 40.0
+        tau = 2 * self.transducer.ls / self.transducer.rs
+        t = np.array([1e-15, 1e-13])
+        expected = (ucw / self.transducer.rs) * (t / tau)
+        np.testing.assert_allclose(
+            activation_current(t, self.transducer, ucw), expected, rtol=1e-9
+        )
+        self.assertAlmostEqual(
+            activation_current(1e-15, self.transducer, ucw) / expected[0], 1.0, places=9
+        )
+
     def test_activation_current_inf(self):
         """t = np.inf should return steady-state current: ucw / rs."""
         i_inf = activation_current(t=np.inf, transducer=self.transducer, ucw=25)
@@ -83,9 +122,10 @@ class TestActivationCurrent(unittest.TestCase):
 class TestSwitchingTime(unittest.TestCase):
     """Tests for the switching_time function."""
 
-    def setUp(self):
-        """Setup transducer for switching time tests."""
-        self.transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Setup a shared transducer for switching time tests."""
+        cls.transducer = Transducer(
             name="SwitchTest", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
         )
 
@@ -97,6 +137,16 @@ class TestSwitchingTime(unittest.TestCase):
         result = switching_time(self.transducer, ub, ucw)
         self.assertGreater(result, 0.0)
 
+    def test_switching_time_reaches_steady_state_amplitude(self):
+        """At t_sw the boosted envelope must equal the steady-state amplitude."""
+        ub = 60.0
+        ucw = 40.0
+        rs, ls = self.transducer.rs, self.transducer.ls
+
+        t_sw = switching_time(self.transducer, ub, ucw)
+        envelope = (ub / rs) * (1 - np.exp(-t_sw / (2 * ls / rs)))
+        self.assertAlmostEqual(envelope, ucw / rs, places=12)
+
     def test_switching_time_invalid_ub_le_ucw(self):
         """Invalid case: ub <= ucw should raise ValueError."""
         with self.assertRaises(ValueError):
@@ -113,9 +163,10 @@ class TestSwitchingTime(unittest.TestCase):
 class TestActivation4Tau(unittest.TestCase):
     """Tests for the activation_4tau function."""
 
-    def setUp(self):
-        """Setup transducer for activation_4tau tests."""
-        self.transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Setup a shared transducer for activation_4tau tests."""
+        cls.transducer = Transducer(
             name="TauTest", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
         )
 
@@ -124,7 +175,7 @@ class TestActivation4Tau(unittest.TestCase):
         ucw = 40.0
 
         result = activation_4tau(self.transducer, ucw)
-        expected_approx = 4.0 * (2 * self.transducer.ls / self.transducer.rs)
+        expected_approx = 4.0 * self.transducer.tau_no_rp
         self.assertAlmostEqual(result, expected_approx, delta=5e-4)
 
     def test_activation_4tau_overboost(self):
@@ -149,9 +200,10 @@ class TestActivation4Tau(unittest.TestCase):
 class TestActivationPotential(unittest.TestCase):
     """Tests for activation_potential and print_activation_potential."""
 
-    def setUp(self):
-        """Setup transducer for activation_potential tests."""
-        self.transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Setup a shared transducer for activation_potential tests."""
+        cls.transducer = Transducer(
             name="PotentialTest", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
         )
 
@@ -169,6 +221,22 @@ class TestActivationPotential(unittest.TestCase):
         self.assertGreater(delta_time, 0)
         self.assertGreater(pct_improvement, 0)
 
+    def test_activation_potential_broadcast(self):
+        """Array inputs broadcast and match the scalar results entry by entry."""
+        ucw = np.array([30.0, 40.0])
+        ub = np.array([[50.0], [60.0], [80.0]])
+
+        results = activation_potential(self.transducer, ucw, ub)
+
+        for values in results:
+            self.assertEqual(values.shape, (3, 2))
+        for i, ub_i in enumerate(ub[:, 0]):
+            for j, ucw_j in enumerate(ucw):
+                expected = activation_potential(self.transducer, ucw_j, ub_i)
+                np.testing.assert_allclose(
+                    [values[i, j] for values in results], expected, rtol=1e-12
+                )
+
     @patch("builtins.print")
     def test_print_activation_potential(self, mock_print):
         """Ensure print_activation_potential calls print at least once."""
@@ -1,22 +1,23 @@
-import logging
-import random
+import dataclasses
 import unittest
 from unittest.mock import patch
 
 import numpy as np
 
 from transientbvd import (
+    DeactivationPotential,
     deactivation_tau,
     deactivation_two_tau,
+    deactivation_tau_batch,
+    deactivation_tau_transducers,
     optimum_resistance,
     deactivation_potential,
     print_deactivation_potential,
     deactivation_current,
+    deactivation_waveform,
 )
 from transientbvd.transducer import Transducer
 
-logging.basicConfig(level=logging.WARNING)
-
 
 class TestPrintDeactivationPotential(unittest.TestCase):
     @patch("builtins.print")  # Mock the print function
@@ -54,45 +55,162 @@ class TestDeactivationPotentialMethod(unittest.TestCase):
         self.assertGreater(delta_time, 0)
         self.assertGreater(percentage_improvement, 0)
 
+    def test_deactivation_potential_named_fields(self):
+        """The result exposes its values by name as well as by position."""
+        transducer = Transducer(
+            name="TestTransducer", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
+        )
+        result = deactivation_potential(transducer, (10, 5000))
+
+        self.assertIsInstance(result, DeactivationPotential)
+        self.assertEqual(result.optimal_resistance, result[0])
+        self.assertEqual(result.tau_with_rp, result[1])
+        self.assertAlmostEqual(
+            result.delta_time, transducer.tau_no_rp - result.tau_with_rp
+        )
+
 
 class TestDecayTimeMethod(unittest.TestCase):
-    def test_deactivation_tau_without_rp(self):
-        """Test deactivation_tau calculation without a parallel resistance (rp=None)."""
-        transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared transducer once for all tests."""
+        cls.transducer = Transducer(
             name="TestTransducer", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
         )
 
+    def test_deactivation_tau_without_rp(self):
+        """Test deactivation_tau calculation without a parallel resistance (rp=None)."""
         # Calculate decay time without rp
-        result = deactivation_tau(transducer)
+        result = deactivation_tau(self.transducer)
 
         # Expected decay time (τ = 2L / R)
-        expected = 2 * transducer.ls / transducer.rs
+        expected = 2 * self.transducer.ls / self.transducer.rs
 
         # Assert the result is correct
         self.assertAlmostEqual(result, expected, places=6)
 
+    def test_deactivation_tau_batch_matches_scalar(self):
+        """Test deactivation_tau_batch agrees with deactivation_tau for each rp."""
+        rp_values = np.geomspace(10, 10_000, 50)
+
+        result = deactivation_tau_batch(self.transducer, rp_values)
+        expected = np.array([deactivation_tau(self.transducer, rp) for rp in rp_values])
+
+        self.assertEqual(result.shape, rp_values.shape)
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_deactivation_tau_batch_invalid_rp(self):
+        """Test deactivation_tau_batch rejects non-positive rp values."""
+        with self.assertRaises(ValueError):
+            deactivation_tau_batch(self.transducer, np.array([100.0, 0.0]))
+
+    def test_deactivation_tau_transducers_matches_scalar(self):
+        """Test deactivation_tau_transducers agrees with deactivation_tau per transducer."""
+        transducers = [
+            self.transducer,
+            Transducer(rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12),
+            Transducer(rs=50.0, ls=20e-3, cs=1e-9, c0=5e-9),
+        ]
+        for rp in (None, 500.0):
+            result = deactivation_tau_transducers(transducers, rp)
+            expected = [deactivation_tau(transducer, rp) for transducer in transducers]
+            np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+        with self.assertRaises(ValueError):
+            deactivation_tau_transducers(transducers, rp=0.0)
+
 
 class TestOptimumResistance(unittest.TestCase):
-    def test_optimum_resistance_basic(self):
-        """Test optimum_resistance calculation with valid parameters."""
-        transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared transducer once for all tests."""
+        cls.transducer = Transducer(
             name="TestTransducer", rs=24.764, ls=38.959e-3, cs=400.33e-12, c0=3970.1e-12
         )
+
+    def test_optimum_resistance_basic(self):
+        """Test optimum_resistance calculation with valid parameters."""
         resistance_range = (10, 1000)  # Resistance range in ohms
 
         optimal_resistance, minimal_decay_time = optimum_resistance(
-            transducer, resistance_range
+            self.transducer, resistance_range
         )
 
         self.assertGreaterEqual(optimal_resistance, resistance_range[0])
         self.assertLessEqual(optimal_resistance, resistance_range[1])
         self.assertGreater(minimal_decay_time, 0)
 
+    def test_optimum_resistance_grid_matches_bounded(self):
+        """The grid search should land close to the bounded optimum."""
+        resistance_range = (10, 10_000)
+
+        rp_bounded, tau_bounded = optimum_resistance(
+            self.transducer, resistance_range, method="bounded"
+        )
+        rp_grid, tau_grid = optimum_resistance(
+            self.transducer, resistance_range, method="grid", grid_points=64
+        )
+
+        self.assertAlmostEqual(rp_grid / rp_bounded, 1.0, delta=1e-4)
+        self.assertAlmostEqual(tau_grid / tau_bounded, 1.0, delta=1e-6)
+
+        # Bounded Brent is the default strategy; the grid search is opt-in
+        self.assertEqual(
+            optimum_resistance(self.transducer, resistance_range),
+            (rp_bounded, tau_bounded),
+        )
+
+    def test_optimum_resistance_analytic_matches_bounded(self):
+        """The analytic estimate refines to the bounded optimum, also when clipped."""
+        for resistance_range in ((10, 10_000), (10, 500)):
+            with self.subTest(resistance_range=resistance_range):
+                rp_bounded, tau_bounded = optimum_resistance(
+                    self.transducer, resistance_range, method="bounded"
+                )
+                rp_analytic, tau_analytic = optimum_resistance(
+                    self.transducer, resistance_range, method="analytic"
+                )
+
+                self.assertAlmostEqual(rp_analytic / rp_bounded, 1.0, delta=1e-4)
+                self.assertAlmostEqual(tau_analytic / tau_bounded, 1.0, delta=1e-6)
+
+    def test_optimum_resistance_analytic_falls_back_outside_estimate(self):
+        """With C0 << Cs the estimate is far off; the result must match the grid."""
+        transducer = Transducer(rs=100, ls=0.5, cs=1e-7, c0=1e-12)
+        resistance_range = (10, 1e7)
+
+        rp_grid, tau_grid = optimum_resistance(
+            transducer, resistance_range, method="grid"
+        )
+        rp_analytic, tau_analytic = optimum_resistance(
+            transducer, resistance_range, method="analytic"
+        )
+
+        self.assertAlmostEqual(rp_analytic / rp_grid, 1.0, delta=1e-4)
+        self.assertAlmostEqual(tau_analytic / tau_grid, 1.0, delta=1e-6)
+
+    @patch("builtins.print")
+    def test_optimum_resistance_bound_hint_is_logged(self, mock_print):
+        """An optimum at the range edge is reported via logging only."""
+        with self.assertLogs(level="WARNING") as logs:
+            optimum_resistance(self.transducer, (10, 500))
+
+        self.assertIn("near the upper bound", logs.output[0])
+        mock_print.assert_not_called()
+
+    def test_optimum_resistance_invalid_method(self):
+        """Unknown methods and too coarse grids are rejected."""
+        with self.assertRaises(ValueError):
+            optimum_resistance(self.transducer, method="newton")
+        with self.assertRaises(ValueError):
+            optimum_resistance(self.transducer, method="grid", grid_points=1)
+
 
 class TestDeactivationCurrent(unittest.TestCase):
-    def setUp(self):
-        """Setup default parameters for transducer tests."""
-        self.transducer = Transducer(
+    @classmethod
+    def setUpClass(cls):
+        """Build the default transducer once for all tests."""
+        cls.template = Transducer(
             name="TestTransducer",
             rs=21.05,
             ls=35.15e-3,
@@ -101,6 +219,10 @@ class TestDeactivationCurrent(unittest.TestCase):
             rp=1000,  # Default parallel resistance
         )
 
+    def setUp(self):
+        """Give each test its own copy, as some tests modify rs/rp."""
+        self.transducer = dataclasses.replace(self.template)
+
     def test_deactivation_current_t_zero(self):
         """Test deactivation_current at t=0 should return exactly i0."""
         i0 = 1.0
@@ -127,12 +249,24 @@ class TestDeactivationCurrent(unittest.TestCase):
         t_early = np.linspace(0.0, 1e-3, 200)  # 0 .. 1 ms
         t_late = np.linspace(10e-3, 20e-3, 400)  # 10 .. 20 ms
 
-        early_vals = np.array(
-            [deactivation_current(float(t), i0, self.transducer) for t in t_early]
+        early_vals = deactivation_current(t_early, i0, self.transducer)
+        late_vals = deactivation_current(t_late, i0, self.transducer)
+
+        # Open circuit: the motional branch rings down like a series RLC with Cs
+        # and C0 in series, i.e. i0 * exp(-alpha*t) * (cos(wd*t) + alpha/wd*sin(wd*t))
+        c_eff = (
+            self.transducer.cs
+            * self.transducer.c0
+            / (self.transducer.cs + self.transducer.c0)
         )
-        late_vals = np.array(
-            [deactivation_current(float(t), i0, self.transducer) for t in t_late]
+        alpha = self.transducer.rs / (2 * self.transducer.ls)
+        omega_d = np.sqrt(1 / (self.transducer.ls * c_eff) - alpha**2)
+        expected_early = (
+            i0
+            * np.exp(-alpha * t_early)
+            * (np.cos(omega_d * t_early) + alpha / omega_d * np.sin(omega_d * t_early))
         )
+        np.testing.assert_allclose(early_vals, expected_early, rtol=0, atol=1e-5)
 
         early_max = float(np.max(np.abs(early_vals)))
         late_max = float(np.max(np.abs(late_vals)))
@@ -146,6 +280,32 @@ class TestDeactivationCurrent(unittest.TestCase):
         # Also ensure we didn't accidentally create a (nearly) constant current solution
         self.assertGreater(early_max - late_max, 0.1)
 
+    def test_deactivation_current_array_matches_scalar(self):
+        """Array input must match the scalar evaluation point by point."""
+        t = np.linspace(0.0, 2e-3, 50)
+        for rp in (None, 1000):
+            self.transducer.rp = rp
+            values = deactivation_current(t, 1.0, self.transducer)
+            self.assertEqual(values.shape, t.shape)
+            expected = [
+                deactivation_current(float(ti), 1.0, self.transducer) for ti in t
+            ]
+            np.testing.assert_allclose(values, expected, rtol=1e-9, atol=1e-12)
+
+    def test_deactivation_waveform_matches_current(self):
+        """The prepared waveform reproduces deactivation_current for scalar and array t."""
+        t = np.linspace(0.0, 2e-3, 50)
+        waveform = deactivation_waveform(1.0, self.transducer, di0=10.0)
+
+        np.testing.assert_array_equal(
+            waveform(t), deactivation_current(t, 1.0, self.transducer, di0=10.0)
+        )
+        for ti in t[::10]:
+            self.assertEqual(
+                waveform(float(ti)),
+                deactivation_current(float(ti), 1.0, self.transducer, di0=10.0),
+            )
+
     def test_deactivation_current_large_t(self):
         """Test deactivation_current for large t (t → ∞) should return ~0."""
         i0 = 1.0
@@ -0,0 +1,51 @@
+import importlib
+import subprocess
+import sys
+import unittest
+
+import transientbvd
+
+
+class TestLazyPackage(unittest.TestCase):
+    """Tests for the lazily populated package namespace."""
+
+    def test_submodules_accessible_as_attributes(self):
+        """Numerical submodules are reachable right after `import transientbvd`."""
+        for name in ("utils", "deactivation", "activation"):
+            with self.subTest(name=name):
+                module = getattr(transientbvd, name)
+                self.assertIs(module, importlib.import_module(f"transientbvd.{name}"))
+
+    def test_submodules_accessible_in_fresh_interpreter(self):
+        """Submodule access works before any lazy name was resolved."""
+        code = (
+            "import transientbvd; "
+            "print(transientbvd.utils.__name__, transientbvd.deactivation.__name__, "
+            "transientbvd.activation.__name__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(
+            result.stdout.split(),
+            [
+                "transientbvd.utils",
+                "transientbvd.deactivation",
+                "transientbvd.activation",
+            ],
+        )
+
+    def test_dir_lists_lazy_names(self):
+        """dir() includes lazily imported functions and submodules."""
+        names = dir(transientbvd)
+        for name in ("deactivation_tau", "roots", "utils", "activation"):
+            self.assertIn(name, names)
+
+    def test_unknown_attribute(self):
+        """Unknown names still raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            getattr(transientbvd, "does_not_exist")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import json
+import math
 import tempfile
 import unittest
 from unittest.mock import patch
@@ -9,20 +10,27 @@ from transientbvd import (
     Transducer,
     load_transducers,
 )
+from transientbvd.transducer import _load_transducer_db_json
+
+# Shared, read-only transducers returned by the mocked database loader
+SMBLTD45F40H_1 = (
+    Transducer(rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12)
+    .set_name("SMBLTD45F40H_1")
+    .set_manufacturer("STEINER & MARTINS INC., Davenport, USA")
+)
+GB_4540_4SH = (
+    Transducer(rs=17.2, ls=32.52e-3, cs=464.1e-12, c0=3.397e-9)
+    .set_name("GB-4540-4SH")
+    .set_manufacturer("Granbo Ultrasonic, Shenzhen, China")
+)
 
 
 class TestTransducerModule(unittest.TestCase):
     @patch(
         "transientbvd.transducer.load_measured_transducers",
         return_value={
-            "SMBLTD45F40H_1": Transducer(
-                rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12
-            )
-            .set_name("SMBLTD45F40H_1")
-            .set_manufacturer("STEINER & MARTINS INC., Davenport, USA"),
-            "GB-4540-4SH": Transducer(rs=17.2, ls=32.52e-3, cs=464.1e-12, c0=3.397e-9)
-            .set_name("GB-4540-4SH")
-            .set_manufacturer("Granbo Ultrasonic, Shenzhen, China"),
+            "SMBLTD45F40H_1": SMBLTD45F40H_1,
+            "GB-4540-4SH": GB_4540_4SH,
         },
     )
     def test_predefined_transducers(self, mock_load):
@@ -38,13 +46,7 @@ class TestTransducerModule(unittest.TestCase):
 
     @patch(
         "transientbvd.transducer.load_measured_transducers",
-        return_value={
-            "SMBLTD45F40H_1": Transducer(
-                rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12
-            )
-            .set_name("SMBLTD45F40H_1")
-            .set_manufacturer("STEINER & MARTINS INC., Davenport, USA")
-        },
+        return_value={"SMBLTD45F40H_1": SMBLTD45F40H_1},
     )
     def test_predefined_transducer_valid(self, mock_load):
         """Test retrieving any valid transducer."""
@@ -61,13 +63,7 @@ class TestTransducerModule(unittest.TestCase):
 
     @patch(
         "transientbvd.transducer.load_measured_transducers",
-        return_value={
-            "SMBLTD45F40H_1": Transducer(
-                rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12
-            )
-            .set_name("SMBLTD45F40H_1")
-            .set_manufacturer("STEINER & MARTINS INC., Davenport, USA")
-        },
+        return_value={"SMBLTD45F40H_1": SMBLTD45F40H_1},
     )
     def test_str_method(self, mock_load):
         """Test the __str__ method of each transducer."""
@@ -79,13 +75,7 @@ class TestTransducerModule(unittest.TestCase):
 
     @patch(
         "transientbvd.transducer.load_measured_transducers",
-        return_value={
-            "SMBLTD45F40H_1": Transducer(
-                rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12
-            )
-            .set_name("SMBLTD45F40H_1")
-            .set_manufacturer("STEINER & MARTINS INC., Davenport, USA")
-        },
+        return_value={"SMBLTD45F40H_1": SMBLTD45F40H_1},
     )
     def test_repr_method(self, mock_load):
         """Test the __repr__ method of each transducer."""
@@ -96,6 +86,25 @@ class TestTransducerModule(unittest.TestCase):
         )  # Ensure the name appears in the representation
         self.assertTrue(transducer_repr.startswith("Transducer("))  # Check format
 
+    def test_as_tuple_and_slots(self):
+        """Test as_tuple() ordering and that instances carry no __dict__."""
+        transducer = Transducer(rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12)
+        self.assertEqual(
+            transducer.as_tuple(), (21.05, 35.15e-3, 448.62e-12, 4075.69e-12)
+        )
+        self.assertFalse(hasattr(transducer, "__dict__"))
+
+    def test_derived_properties(self):
+        """Test tau_no_rp and angular_frequency follow the current parameters."""
+        transducer = Transducer(rs=21.05, ls=35.15e-3, cs=448.62e-12, c0=4075.69e-12)
+        self.assertAlmostEqual(transducer.tau_no_rp, 2 * 35.15e-3 / 21.05)
+        self.assertAlmostEqual(
+            transducer.angular_frequency, 2 * math.pi * transducer.frequency
+        )
+
+        transducer.rs = 42.1
+        self.assertAlmostEqual(transducer.tau_no_rp, 2 * 35.15e-3 / 42.1)
+
 
 class TestJSONLoading(unittest.TestCase):
     def test_load_transducers(self):
@@ -124,6 +133,61 @@ class TestJSONLoading(unittest.TestCase):
         self.assertEqual(transducer.name, "SMBLTD45F40H_1")
         self.assertAlmostEqual(transducer.rs, 21.05)
 
+    def test_load_transducers_from_mapping(self):
+        """An already parsed database mapping is accepted without touching disk."""
+        test_data = {"T1": {"rs": 20.0, "ls": 0.03, "cs": 4e-10, "c0": 4e-9, "rp": 800}}
+
+        transducer = load_transducers(test_data)["T1"]
+
+        self.assertEqual(transducer.name, "T1")
+        self.assertAlmostEqual(transducer.rs, 20.0)
+        self.assertAlmostEqual(transducer.rp, 800.0)
+        self.assertEqual(transducer.manufacturer, "Unknown")
+
+    def test_load_transducers_cached_returns_fresh_objects(self):
+        """Repeated loads reuse the parsed file but return independent objects."""
+        test_data = {"T1": {"rs": 20.0, "ls": 0.03, "cs": 4e-10, "c0": 4e-9}}
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+            json.dump(test_data, temp_file)
+            temp_file_path = temp_file.name
+
+        first = load_transducers(temp_file_path)["T1"]
+        first.set_rp(500)
+        second = load_transducers(temp_file_path)["T1"]
+
+        self.assertIsNot(first, second)
+        self.assertIsNone(second.rp)
+
+    def test_load_transducers_picks_up_file_changes(self):
+        """A modified file is re-read instead of served from the cache."""
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+            json.dump(
+                {"T1": {"rs": 20.0, "ls": 0.03, "cs": 4e-10, "c0": 4e-9}}, temp_file
+            )
+            temp_file_path = temp_file.name
+        self.assertAlmostEqual(load_transducers(temp_file_path)["T1"].rs, 20.0)
+
+        # Rewritten right away: the mtime may not change on coarse filesystems
+        with open(temp_file_path, "w", encoding="utf-8") as f:
+            json.dump({"T1": {"rs": 130.0, "ls": 0.03, "cs": 4e-10, "c0": 4e-9}}, f)
+
+        self.assertAlmostEqual(load_transducers(temp_file_path)["T1"].rs, 130.0)
+
+    def test_cached_database_is_read_only(self):
+        """The cached parsed database cannot be modified by callers."""
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+            json.dump(
+                {"T1": {"rs": 20.0, "ls": 0.03, "cs": 4e-10, "c0": 4e-9}}, temp_file
+            )
+            temp_file_path = temp_file.name
+
+        data = _load_transducer_db_json(temp_file_path)
+        with self.assertRaises(TypeError):
+            data["T2"] = {}
+        with self.assertRaises(TypeError):
+            data["T1"]["rs"] = 1.0
+        self.assertAlmostEqual(load_transducers(temp_file_path)["T1"].rs, 20.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,18 +1,23 @@
 import math
-import random
 import unittest
 import numpy as np
 
-from transientbvd.utils import resonance_frequency, roots
+from transientbvd.utils import (
+    resonance_frequency,
+    resonance_frequency_batch,
+    roots,
+    roots_batch,
+)
 
 
 class TestRootsMethod(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Setup default parameters for tests."""
-        self.rs = 24.764  # ohms
-        self.ls = 38.959e-3  # henries
-        self.cs = 400.33e-12  # farads
-        self.c0 = 3970.1e-12  # farads
+        cls.rs = 24.764  # ohms
+        cls.ls = 38.959e-3  # henries
+        cls.cs = 400.33e-12  # farads
+        cls.c0 = 3970.1e-12  # farads
 
     def test_valid_roots_no_rp(self):
         """Test roots calculation without parallel resistance (rp=None)."""
@@ -59,16 +64,101 @@ class TestRootsMethod(unittest.TestCase):
 
     def test_randomized_roots(self):
         """Test roots calculation with randomized positive non-zero values."""
-        for _ in range(100):
-            rs = random.uniform(1, 100)
-            ls = random.uniform(1e-3, 1e-1)
-            cs = random.uniform(1e-12, 1e-6)
-            c0 = random.uniform(1e-12, 1e-6)
-            rp = random.choice([None, random.uniform(1, 1000)])
-            result = roots(rs, ls, cs, c0, rp)
+        rng = np.random.default_rng(0)
+        rs_values = rng.uniform(1, 100, 100)
+        ls_values = rng.uniform(1e-3, 1e-1, 100)
+        cs_values = rng.uniform(1e-12, 1e-6, 100)
+        c0_values = rng.uniform(1e-12, 1e-6, 100)
+        rp_values = rng.uniform(1, 1000, 100)
+        open_circuit = rng.random(100) < 0.5
+        for i in range(100):
+            rp = None if open_circuit[i] else float(rp_values[i])
+            result = roots(
+                float(rs_values[i]),
+                float(ls_values[i]),
+                float(cs_values[i]),
+                float(c0_values[i]),
+                rp,
+            )
             self.assertEqual(len(result), 3)
             self.assertTrue(all(isinstance(root, complex) for root in result))
 
+    def test_roots_match_numpy(self):
+        """The closed-form solver agrees with np.roots on the same polynomial."""
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            rs = rng.uniform(1, 100)
+            ls = 10 ** rng.uniform(-6, 0)
+            cs = 10 ** rng.uniform(-12, -6)
+            c0 = 10 ** rng.uniform(-12, -6)
+            rp = 10 ** rng.uniform(0, 6)
+            a2 = rs / ls + 1 / (rp * c0)
+            a1 = rs / (rp * ls * c0) + 1 / (ls * cs) + 1 / (ls * c0)
+            a0 = 1 / (ls * cs * rp * c0)
+
+            result = np.array(roots(rs, ls, cs, c0, rp))
+            expected = np.roots([1.0, a2, a1, a0])
+            expected = np.array(
+                sorted(expected, key=lambda z: (z.real, z.imag), reverse=True)
+            )
+            scale = np.max(np.abs(expected))
+            np.testing.assert_allclose(result / scale, expected / scale, atol=1e-9)
+
+    def test_roots_open_circuit_has_exact_zero(self):
+        """Open circuit (rp=None) yields an exact zero root, never a positive one."""
+        result = roots(self.rs, self.ls, self.cs, self.c0)
+        self.assertEqual(result[0], 0j)
+        self.assertTrue(all(r.real < 0 for r in result[1:]))
+
+    def test_roots_three_real(self):
+        """Heavily damped case with three distinct real roots."""
+        rs, ls, cs, c0, rp = 1000.0, 1e-3, 1e-6, 1e-6, 10.0
+        a2 = rs / ls + 1 / (rp * c0)
+        a1 = rs / (rp * ls * c0) + 1 / (ls * cs) + 1 / (ls * c0)
+        a0 = 1 / (ls * cs * rp * c0)
+        result = roots(rs, ls, cs, c0, rp)
+
+        self.assertTrue(all(r.imag == 0 for r in result))
+        for r in result:
+            residual = ((r + a2) * r + a1) * r + a0
+            self.assertLess(abs(residual), 1e-9 * (abs(r) ** 3 + a1 * abs(r) + a0))
+
+    def test_roots_batch_matches_roots(self):
+        """roots_batch reproduces roots for every parameter set, open circuit included."""
+        rng = np.random.default_rng(2)
+        rs = rng.uniform(1, 100, 100)
+        ls = rng.uniform(1e-3, 1e-1, 100)
+        cs = rng.uniform(1e-12, 1e-6, 100)
+        c0 = rng.uniform(1e-12, 1e-6, 100)
+        rp = rng.uniform(1, 1000, 100)
+        rp[::2] = np.inf
+
+        result = roots_batch(rs, ls, cs, c0, rp)
+        expected = np.array(
+            [
+                roots(*map(float, params), None if np.isinf(r) else float(r))
+                for *params, r in zip(rs, ls, cs, c0, rp)
+            ]
+        )
+
+        self.assertEqual(result.shape, (100, 3))
+        scale = np.max(np.abs(expected), axis=1, keepdims=True)
+        np.testing.assert_allclose(result / scale, expected / scale, atol=1e-12)
+        np.testing.assert_array_equal(result[::2, 0], 0)
+
+    def test_roots_batch_scalar_and_invalid(self):
+        """Scalar input yields a single row; invalid parameters raise ValueError."""
+        result = roots_batch(self.rs, self.ls, self.cs, self.c0, 900)
+        self.assertEqual(result.shape, (3,))
+        np.testing.assert_allclose(
+            result, roots(self.rs, self.ls, self.cs, self.c0, 900), rtol=1e-12
+        )
+
+        with self.assertRaises(ValueError):
+            roots_batch(np.array([self.rs, -1.0]), self.ls, self.cs, self.c0)
+        with self.assertRaises(ValueError):
+            roots_batch(self.rs, self.ls, self.cs, self.c0, rp=np.array([100.0, 0.0]))
+
     def test_extremely_small_values(self):
         """Test roots calculation with extremely small positive values."""
         rs = 1e-3
@@ -94,6 +184,17 @@ class TestRootsMethod(unittest.TestCase):
             self.assertFalse(math.isinf(r.real))
             self.assertFalse(math.isnan(r.real))
 
+    def test_roots_far_beyond_physical_range(self):
+        """Coefficients up to ~1e160 must not overflow intermediate powers."""
+        rs, ls, cs, c0, rp = 1.0, 1e-30, 1e-30, 1e-60, 1e-40
+        a0 = 1 / (ls * cs * rp * c0)
+        result = roots(rs, ls, cs, c0, rp)
+
+        self.assertTrue(all(math.isfinite(abs(r)) for r in result))
+        # Vieta: the product of the roots equals -a0
+        product = result[0] * result[1] * result[2]
+        self.assertAlmostEqual(product.real / -a0, 1.0, places=9)
+
     def test_difference_with_and_without_rp(self):
         """Test that the roots change when a parallel resistor is provided
         compared to the deactivation scenario."""
@@ -135,12 +236,24 @@ class TestResonanceFrequencyMethod(unittest.TestCase):
 
     def test_randomized_resonance_frequency(self):
         """Test resonance frequency with randomized positive values."""
-        for _ in range(100):
-            ls = random.uniform(1e-6, 1e-3)
-            cs = random.uniform(1e-12, 1e-6)
-            result = resonance_frequency(ls, cs)
-            expected = 1 / (2 * np.pi * (ls * cs) ** 0.5)
-            self.assertAlmostEqual(result, expected, places=6)
+        rng = np.random.default_rng(0)
+        ls_values = rng.uniform(1e-6, 1e-3, 100)
+        cs_values = rng.uniform(1e-12, 1e-6, 100)
+        results = resonance_frequency_batch(ls_values, cs_values)
+        expected = 1 / (2 * np.pi * np.sqrt(ls_values * cs_values))
+        # Same tolerance as assertAlmostEqual(places=6), checked for all values at once
+        np.testing.assert_allclose(results, expected, rtol=0, atol=5e-7)
+
+    def test_resonance_frequency_batch_matches_scalar(self):
+        """The batch variant broadcasts and agrees with resonance_frequency."""
+        ls_values = np.array([10e-6, 38.959e-3, 1e-3])
+        result = resonance_frequency_batch(ls_values, 400.33e-12)
+        self.assertEqual(result.shape, (3,))
+        for ls, freq in zip(ls_values, result):
+            self.assertAlmostEqual(freq, resonance_frequency(float(ls), 400.33e-12))
+
+        with self.assertRaises(ValueError):
+            resonance_frequency_batch(ls_values, np.array([1e-12, 0.0, 1e-12]))
 
 
 if __name__ == "__main__":
@@ -1,28 +1,16 @@
 # __init__.py
 """
 TransientBVD: A library for analyzing transient behavior in the Butterworth-Van Dyke (BVD) model.
+
+Only the lightweight transducer helpers are imported eagerly. The numerical
+modules (which pull in NumPy) are imported on first attribute access, so
+``from transientbvd import Transducer`` stays cheap.
 """
 
-# deactivation.py
-from .deactivation import (
-    deactivation_potential,
-    print_deactivation_potential,
-    deactivation_tau,
-    deactivation_two_tau,
-    optimum_resistance,
-    deactivation_current,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-# activation.py
-from .activation import (
-    activation_current,
-    switching_time,
-    activation_4tau,
-    activation_potential,
-    print_activation_potential,
-)
-
-# transducer.py
+# transducer.py (standard library only, imported eagerly)
 from .transducer import (
     Transducer,
     load_transducers,
@@ -30,21 +18,106 @@ from .transducer import (
     predefined_transducers,
 )
 
-# utils.py
-from .utils import (
-    resonance_frequency,
-    roots,
-)
+if TYPE_CHECKING:
+    # deactivation.py
+    from .deactivation import (
+        DeactivationPotential,
+        deactivation_potential,
+        print_deactivation_potential,
+        deactivation_tau,
+        deactivation_two_tau,
+        deactivation_tau_batch,
+        deactivation_tau_transducers,
+        optimum_resistance,
+        deactivation_current,
+        deactivation_waveform,
+    )
+
+    # activation.py
+    from .activation import (
+        activation_current,
+        switching_time,
+        activation_4tau,
+        activation_potential,
+        print_activation_potential,
+    )
+
+    # utils.py
+    from .utils import (
+        resonance_frequency,
+        resonance_frequency_batch,
+        roots,
+        roots_batch,
+    )
+
+# Public names that are resolved lazily, mapped to their defining submodule
+_LAZY_IMPORTS = {
+    # From deactivation.py
+    "DeactivationPotential": ".deactivation",
+    "deactivation_potential": ".deactivation",
+    "print_deactivation_potential": ".deactivation",
+    "deactivation_tau": ".deactivation",
+    "deactivation_two_tau": ".deactivation",
+    "deactivation_tau_batch": ".deactivation",
+    "deactivation_tau_transducers": ".deactivation",
+    "optimum_resistance": ".deactivation",
+    "deactivation_current": ".deactivation",
+    "deactivation_waveform": ".deactivation",
+    # From activation.py
+    "activation_current": ".activation",
+    "switching_time": ".activation",
+    "activation_4tau": ".activation",
+    "activation_potential": ".activation",
+    "print_activation_potential": ".activation",
+    # From utils.py
+    "resonance_frequency": ".utils",
+    "resonance_frequency_batch": ".utils",
+    "roots": ".utils",
+    "roots_batch": ".utils",
+}
+
+# Numerical submodules, importable as attributes like an eager package would allow
+_LAZY_SUBMODULES = ("activation", "deactivation", "utils")
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import numerical submodules and their public names on first access (PEP 562).
+
+    The resolved object is stored in the module namespace, so later lookups
+    are plain attribute accesses that no longer go through this function.
+    """
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        module_name = _LAZY_IMPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    Include the lazily imported names and submodules, e.g. for tab completion.
+    """
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
+
 
 # Define an __all__ so that `from transientbvd import *` will only import these symbols
 __all__ = [
     # From deactivation.py
+    "DeactivationPotential",
     "deactivation_potential",
     "print_deactivation_potential",
     "deactivation_tau",
     "deactivation_two_tau",
+    "deactivation_tau_batch",
+    "deactivation_tau_transducers",
     "optimum_resistance",
     "deactivation_current",
+    "deactivation_waveform",
     # From activation.py
     "activation_current",
     "switching_time",
@@ -58,5 +131,7 @@ __all__ = [
     "predefined_transducers",
     # From utils.py
     "resonance_frequency",
+    "resonance_frequency_batch",
     "roots",
+    "roots_batch",
 ]
@@ -6,7 +6,7 @@ response of resonant circuits modeled by the Butterworth-Van Dyke (BVD)
 equivalent circuit.
 """
 
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 import math
 
 import numpy as np
@@ -31,27 +31,37 @@ def print_activation_potential(transducer: Transducer, ucw: float, ub: float) ->
         activation_potential(transducer, ucw, ub)
     )
 
-    print("=" * 50)
-    print("Activation Overboosting Potential Analysis")
-    print("=" * 50)
-
-    print(transducer)
-
-    print(f"Switching Time (t_sw): {t_sw:.6f} s ({t_sw * 1e3:.2f} ms)")
-    print(
-        f"4τ without Overboosting: {tau_no_boost:.6f} s ({tau_no_boost * 1e3:.2f} ms)"
-    )
     print(
-        f"4τ with Overboosting: {tau_with_boost:.6f} s ({tau_with_boost * 1e3:.2f} ms)"
+        "\n".join(
+            [
+                "=" * 50,
+                "Activation Overboosting Potential Analysis",
+                "=" * 50,
+                str(transducer),
+                f"Switching Time (t_sw): {t_sw:.6f} s ({t_sw * 1e3:.2f} ms)",
+                f"4τ without Overboosting: {tau_no_boost:.6f} s "
+                f"({tau_no_boost * 1e3:.2f} ms)",
+                f"4τ with Overboosting: {tau_with_boost:.6f} s "
+                f"({tau_with_boost * 1e3:.2f} ms)",
+                f"Absolute Time Improvement: {delta_time:.6f} s ({delta_time * 1e3:.2f} ms)",
+                f"Percentage Time Improvement: {percentage_improvement:.2f}%",
+                "=" * 50,
+            ]
+        )
     )
-    print(f"Absolute Time Improvement: {delta_time:.6f} s ({delta_time * 1e3:.2f} ms)")
-    print(f"Percentage Time Improvement: {percentage_improvement:.2f}%")
-    print("=" * 50)
 
 
 def activation_potential(
-    transducer: Transducer, ucw: float, ub: float
-) -> Tuple[float, float, float, float, float]:
+    transducer: Transducer,
+    ucw: Union[float, np.ndarray],
+    ub: Union[float, np.ndarray],
+) -> Tuple[
+    Union[float, np.ndarray],
+    Union[float, np.ndarray],
+    Union[float, np.ndarray],
+    Union[float, np.ndarray],
+    Union[float, np.ndarray],
+]:
     """
     Evaluate the potential improvement in transient response time when using overboosting
     in the activation scenario.
@@ -60,24 +70,34 @@ def activation_potential(
     ----------
     transducer : Transducer
         The transducer containing the circuit parameters.
-    ucw : float
+    ucw : float or np.ndarray
         Continuous-wave voltage amplitude in volts.
-    ub : float
+    ub : float or np.ndarray
         Overboost voltage amplitude in volts.
 
     Returns
     -------
     Tuple[float, float, float, float, float]
         (t_sw, tau_no_boost, tau_with_boost, delta_time, percentage_improvement).
+        If `ucw` or `ub` is an array, both are broadcast against each other and
+        each entry of the tuple is an array of the broadcast shape.
     """
     # Validate input parameters
-    assert ucw > 0, "ucw must be positive."
-    if ub <= ucw:
+    assert np.all(np.asarray(ucw) > 0), "ucw must be positive."
+    if np.any(np.asarray(ub) <= np.asarray(ucw)):
         raise ValueError("ub must be greater than ucw.")
 
-    t_sw = switching_time(transducer, ub, ucw)
-    tau_no_boost = activation_4tau(transducer, ucw)
-    tau_with_boost = activation_4tau(transducer, ucw, ub, t_sw)
+    if np.ndim(ucw) > 0 or np.ndim(ub) > 0:
+        return _activation_potential_array(transducer, ucw, ub)
+
+    rs, ls = transducer.rs, transducer.ls
+    assert rs > 0 and ls > 0, "Circuit parameters must be positive."
+
+    # Same closed forms as switching_time and activation_4tau, sharing tau
+    tau = 2.0 * ls / rs
+    t_sw = -tau * math.log1p(-ucw / ub)
+    tau_no_boost = _activation_4tau_core(rs, tau, ucw)
+    tau_with_boost = _activation_4tau_core(rs, tau, ucw, ub, t_sw)
 
     delta_time = tau_no_boost - tau_with_boost
     percentage_improvement = (
@@ -87,21 +107,62 @@ def activation_potential(
     return t_sw, tau_no_boost, tau_with_boost, delta_time, percentage_improvement
 
 
+def _activation_potential_array(
+    transducer: Transducer, ucw: np.ndarray, ub: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of `activation_potential` for broadcastable `ucw`/`ub`.
+
+    Uses the same closed forms as `switching_time` and `activation_4tau`.
+    """
+    rs, ls = transducer.rs, transducer.ls
+    assert rs > 0 and ls > 0, "Circuit parameters must be positive."
+    ucw, ub = np.broadcast_arrays(
+        np.asarray(ucw, dtype=float), np.asarray(ub, dtype=float)
+    )
+
+    tau = 2.0 * ls / rs
+    threshold = 0.982 * ucw / rs  # 98.2% of the steady-state current -> 4τ
+
+    t_sw = -tau * np.log1p(-ucw / ub)
+    tau_no_boost = np.full(ucw.shape, -tau * math.log1p(-0.982))
+
+    growth = np.exp(t_sw / tau)
+    amp_t_sw = (ub / rs) * -np.expm1(-t_sw / tau)
+    # np.where evaluates both branches; the log branch is only valid where the
+    # threshold has not been reached at t_sw, so silence it elsewhere.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau_with_boost = np.where(
+            amp_t_sw >= threshold,
+            t_sw,
+            tau
+            * np.log(
+                (ub * np.expm1(t_sw / tau) - ucw * growth) / (rs * threshold - ucw)
+            ),
+        )
+
+    delta_time = tau_no_boost - tau_with_boost
+    percentage_improvement = (delta_time / tau_no_boost) * 100
+
+    return t_sw, tau_no_boost, tau_with_boost, delta_time, percentage_improvement
+
+
 def activation_current(
-    t: float,
+    t: Union[float, np.ndarray],
     transducer: Transducer,
     ucw: float,
     ub: Optional[float] = None,
     t_sw: Optional[float] = None,
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Compute the transient current response for an activation BVD model.
 
     Parameters
     ----------
-    t : float
+    t : float or np.ndarray
         Time in seconds. If `np.inf` is provided, this returns the
-        steady-state current (`U_cw / R_s`).
+        steady-state current (`U_cw / R_s`). If an array is provided, the
+        current is evaluated for all time points at once.
     transducer : Transducer
         The transducer containing the circuit parameters.
     ucw : float
@@ -114,11 +175,12 @@ def activation_current(
 
     Returns
     -------
-    float
-        The transient current at time `t`.
+    float or np.ndarray
+        The transient current at time `t`. An array of the same shape is
+        returned if `t` is an array.
     """
 
-    assert t >= 0, "Time must be non-negative."
+    assert np.all(np.asarray(t) >= 0), "Time must be non-negative."
 
     # Extract circuit parameters
     rs, ls, cs = transducer.rs, transducer.ls, transducer.cs
@@ -127,7 +189,7 @@ def activation_current(
     assert ucw > 0, "ucw must be positive."
     assert rs > 0 and ls > 0 and cs > 0, "Circuit parameters must be positive."
 
-    if t == np.inf:
+    if np.ndim(t) == 0 and t == np.inf:
         return abs(ucw / rs)
 
     if ub is not None:
@@ -145,20 +207,87 @@ def activation_current(
     w_r = 1.0 / math.sqrt(ls * cs)
     tau = 2.0 * ls / rs
 
+    if np.ndim(t) > 0:
+        return _activation_current_array(
+            np.asarray(t, dtype=float), rs, w_r, tau, ucw, ub, t_sw
+        )
+
+    return _activation_current_scalar(float(t), rs, w_r, tau, ucw, ub, t_sw)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _activation_current_scalar(
+    t: float,
+    rs: float,
+    w_r: float,
+    tau: float,
+    ucw: float,
+    ub: Optional[float],
+    t_sw: Optional[float],
+) -> float:
+    """
+    Evaluate the activation current for a single, finite time point.
+
+    Unvalidated float kernel using only `math`; callers are expected to have
+    checked the inputs (see `activation_current`).
+    """
     if ub is not None and t_sw is not None:
         if t < t_sw:
-            return (ub / rs) * math.cos(w_r * t) * (1 - math.exp(-t / tau))
-
-        # else t >= t_sw
-        amp_t_sw = (ub / rs) * (1 - math.exp(-t_sw / tau))
-        phase_offset = w_r * t_sw
-        return amp_t_sw * math.exp(-(t - t_sw) / tau) * math.cos(
-            w_r * (t - t_sw) + phase_offset
-        ) + (ucw / rs) * math.cos(w_r * (t - t_sw) + phase_offset) * (
-            1 - math.exp(-(t - t_sw) / tau)
+            return (ub / rs) * math.cos(w_r * t) * -math.expm1(-t / tau)
+
+        # else t >= t_sw: the envelope relaxes from its value at t_sw towards
+        # the steady state, the phase w_r*(t - t_sw) + w_r*t_sw simply is w_r*t
+        amp_t_sw = (ub / rs) * -math.expm1(-t_sw / tau)
+        steady_state_current = ucw / rs
+        return math.cos(w_r * t) * (
+            steady_state_current
+            + (amp_t_sw - steady_state_current) * math.exp(-(t - t_sw) / tau)
         )
 
-    return (ucw / rs) * math.cos(w_r * t) * (1 - math.exp(-t / tau))
+    return (ucw / rs) * math.cos(w_r * t) * -math.expm1(-t / tau)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _activation_current_array(
+    t: np.ndarray,
+    rs: float,
+    w_r: float,
+    tau: float,
+    ucw: float,
+    ub: Optional[float],
+    t_sw: Optional[float],
+) -> np.ndarray:
+    """
+    Evaluate the activation current for an array of time points.
+
+    Vectorized counterpart of `_activation_current_scalar`. Entries equal to
+    `np.inf` are set to the steady-state current up front, so the expressions
+    below only ever see finite times; before/after the switching time each
+    expression is evaluated only on the entries it applies to. The charging
+    factor 1 - exp(-t/tau) is computed as -expm1(-t/tau), which stays accurate
+    for t much smaller than tau.
+    """
+    finite = np.isfinite(t)
+    current = np.full(t.shape, abs(ucw / rs))
+    t_fin = t[finite]
+
+    # The carrier phase is w_r*t before and after the switching time
+    values = np.cos(w_r * t_fin)
+
+    if ub is not None and t_sw is not None:
+        boosting = t_fin < t_sw
+        values[boosting] *= (ub / rs) * -np.expm1(-t_fin[boosting] / tau)
+
+        amp_t_sw = (ub / rs) * -math.expm1(-t_sw / tau)
+        steady_state_current = ucw / rs
+        values[~boosting] *= steady_state_current + (
+            amp_t_sw - steady_state_current
+        ) * np.exp(-(t_fin[~boosting] - t_sw) / tau)
+    else:
+        values *= (ucw / rs) * -np.expm1(-t_fin / tau)
+
+    current[finite] = values
+    return current
 
 
 def switching_time(transducer: Transducer, ub: float, ucw: float) -> float:
@@ -187,8 +316,10 @@ def switching_time(transducer: Transducer, ub: float, ucw: float) -> float:
         raise ValueError("ub must be greater than ucw.")
     assert rs > 0 and ls > 0, "Circuit parameters must be positive."
 
+    # Closed form of (ub / rs) * (1 - exp(-t_sw / tau)) = ucw / rs;
+    # log1p keeps full precision when ucw is small compared to ub.
     tau = 2.0 * ls / rs
-    return -tau * math.log(1.0 - (ucw / ub))
+    return -tau * math.log1p(-ucw / ub)
 
 
 def activation_4tau(
@@ -229,17 +360,29 @@ def activation_4tau(
     if ub is not None and t_sw is None:
         t_sw = switching_time(transducer, ub, ucw)
 
-    tau = 2.0 * ls / rs
+    return _activation_4tau_core(rs, 2.0 * ls / rs, ucw, ub, t_sw)
+
+
+def _activation_4tau_core(
+    rs: float,
+    tau: float,
+    ucw: float,
+    ub: Optional[float] = None,
+    t_sw: Optional[float] = None,
+) -> float:
+    """
+    Unvalidated float kernel of `activation_4tau` for a precomputed `tau`.
+    """
     steady_state_current = ucw / rs
     threshold = 0.982 * steady_state_current  # 98.2% threshold -> 4τ
 
     if ub is not None and t_sw is not None:
-        amp_t_sw = (ub / rs) * (1 - math.exp(-t_sw / tau))
+        amp_t_sw = (ub / rs) * -math.expm1(-t_sw / tau)
         if amp_t_sw >= threshold:
             return t_sw
         return tau * math.log(
-            (ub * math.exp(t_sw / tau) - ub - ucw * math.exp(t_sw / tau))
+            (ub * math.expm1(t_sw / tau) - ucw * math.exp(t_sw / tau))
             / (rs * threshold - ucw)
         )
 
-    return -tau * math.log(1.0 - (threshold * rs / ucw))
+    return -tau * math.log1p(-threshold * rs / ucw)
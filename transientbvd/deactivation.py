@@ -10,14 +10,42 @@ and computing transient currents using the system's characteristic polynomial.
 
 import cmath
 import logging
+import math
+from typing import Callable
+from typing import NamedTuple
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
+from typing import Union
 
 import numpy as np
-from scipy.optimize import minimize_scalar
 
 from .transducer import Transducer
-from .utils import roots
+from .utils import _cubic_roots_batch, _roots_core, roots
+
+
+class DeactivationPotential(NamedTuple):
+    """
+    Result of `deactivation_potential`.
+
+    Unpacks like a plain 4-tuple and additionally offers named access.
+
+    Parameters
+    ----------
+    optimal_resistance : float
+        Optimal parallel resistance Rp in ohms.
+    tau_with_rp : float
+        Decay time in seconds using `optimal_resistance`.
+    delta_time : float
+        Absolute improvement tau_no_rp - tau_with_rp in seconds.
+    percentage_improvement : float
+        Relative improvement 100 * delta_time / tau_no_rp.
+    """
+
+    optimal_resistance: float
+    tau_with_rp: float
+    delta_time: float
+    percentage_improvement: float
 
 
 def print_deactivation_potential(
@@ -43,36 +71,37 @@ def print_deactivation_potential(
         deactivation_potential(transducer, resistance_range)
     )
 
-    # Extract circuit parameters directly from the Transducer object
-    rs, ls = transducer.rs, transducer.ls
-
     # Calculate decay times without using Rp
-    tau_no_rp = 2 * ls / rs
+    tau_no_rp = transducer.tau_no_rp
     two_tau_no_rp = 2 * tau_no_rp
 
     # Calculate 2τ for Rp
     two_tau_with_rp = 2 * tau_with_rp
 
-    # Pretty print the results
-    print("=" * 50)
-    print("Deactivation Potential Analysis")
-    print("=" * 50)
-
-    print(transducer)
-
-    print(f"Optimal Parallel Resistance (Rp): {optimal_resistance:.2f} Ω")
-    print(f"Decay Time (τ) without Rp: {tau_no_rp:.6f} s ({tau_no_rp * 1e3:.2f} ms)")
-    print(f"Decay Time (τ) with Rp: {tau_with_rp:.6f} s ({tau_with_rp * 1e3:.2f} ms)")
-    print(f"2τ without Rp: {two_tau_no_rp:.6f} s ({two_tau_no_rp * 1e3:.2f} ms)")
-    print(f"2τ with Rp: {two_tau_with_rp:.6f} s ({two_tau_with_rp * 1e3:.2f} ms)")
-    print(f"Absolute Time Improvement: {delta_time:.6f} s ({delta_time * 1e3:.2f} ms)")
-    print(f"Percentage Time Improvement: {percentage_improvement:.2f}%")
-    print("=" * 50)
+    # Pretty print the results in a single write
+    print(
+        "\n".join(
+            [
+                "=" * 50,
+                "Deactivation Potential Analysis",
+                "=" * 50,
+                str(transducer),
+                f"Optimal Parallel Resistance (Rp): {optimal_resistance:.2f} Ω",
+                f"Decay Time (τ) without Rp: {tau_no_rp:.6f} s ({tau_no_rp * 1e3:.2f} ms)",
+                f"Decay Time (τ) with Rp: {tau_with_rp:.6f} s ({tau_with_rp * 1e3:.2f} ms)",
+                f"2τ without Rp: {two_tau_no_rp:.6f} s ({two_tau_no_rp * 1e3:.2f} ms)",
+                f"2τ with Rp: {two_tau_with_rp:.6f} s ({two_tau_with_rp * 1e3:.2f} ms)",
+                f"Absolute Time Improvement: {delta_time:.6f} s ({delta_time * 1e3:.2f} ms)",
+                f"Percentage Time Improvement: {percentage_improvement:.2f}%",
+                "=" * 50,
+            ]
+        )
+    )
 
 
 def deactivation_potential(
     transducer: Transducer, resistance_range: Tuple[float, float] = (10, 5000)
-) -> Tuple[float, float, float, float]:
+) -> DeactivationPotential:
     """
     Evaluate deactivation performance over a resistance range.
 
@@ -91,8 +120,8 @@ def deactivation_potential(
 
     Returns
     -------
-    Tuple[float, float, float, float]
-        (optimal_resistance, tau_with_rp, delta_time, percentage_improvement)
+    DeactivationPotential
+        Named tuple (optimal_resistance, tau_with_rp, delta_time, percentage_improvement)
         where:
         - optimal_resistance is Rp in ohms
         - tau_with_rp is the decay time in seconds using optimal_resistance
@@ -100,7 +129,7 @@ def deactivation_potential(
         - percentage_improvement = 100 * delta_time / tau_no_rp
     """
     # Extract parameters from transducer
-    rs, ls, cs, c0 = transducer.rs, transducer.ls, transducer.cs, transducer.c0
+    rs, ls, cs, c0 = transducer.as_tuple()
 
     # Validate input parameters
     if rs <= 0 or ls <= 0 or cs <= 0 or c0 <= 0:
@@ -113,7 +142,7 @@ def deactivation_potential(
         )
 
     # Calculate the decay time without using rp (τ = 2L / R)
-    tau_no_rp = 2 * ls / rs
+    tau_no_rp = transducer.tau_no_rp
 
     # Calculate the optimal resistance and its corresponding decay time
     optimal_resistance, tau_with_rp = optimum_resistance(transducer, resistance_range)
@@ -122,7 +151,9 @@ def deactivation_potential(
     delta_time = tau_no_rp - tau_with_rp
     percentage_improvement = (delta_time / tau_no_rp) * 100 if tau_no_rp > 0 else 0.0
 
-    return optimal_resistance, tau_with_rp, delta_time, percentage_improvement
+    return DeactivationPotential(
+        optimal_resistance, tau_with_rp, delta_time, percentage_improvement
+    )
 
 
 def deactivation_tau(transducer: Transducer, rp: Optional[float] = None) -> float:
@@ -164,33 +195,39 @@ def deactivation_tau(transducer: Transducer, rp: Optional[float] = None) -> floa
     if rp is not None and rp <= 0:
         raise ValueError("rp must be positive if provided.")
 
+    return _tau_core(*transducer.as_tuple(), rp)
+
+
+def _tau_core(
+    rs: float, ls: float, cs: float, c0: float, rp: Optional[float] = None
+) -> float:
+    """
+    Decay time kernel operating on plain floats.
+
+    This is the numerical core of `deactivation_tau`. It performs no parameter
+    validation and takes no `Transducer`, so it can be called directly from
+    optimization loops and parameter sweeps without per-call overhead.
+    """
     if rp is None:
         # Calculate the decay time without using rp (τ = 2L / R)
-        return 2 * transducer.ls / transducer.rs
+        return 2 * ls / rs
 
-    calculated_roots = roots(
-        transducer.rs, transducer.ls, transducer.cs, transducer.c0, rp=rp
-    )
+    # Roots come sorted by real part, descending
+    calculated_roots = _roots_core(rs, ls, cs, c0, rp)
 
-    # If any root is unstable, fail loudly
-    for r in calculated_roots:
-        if complex(r).real > 1e-12:
-            raise ValueError(f"Unstable system: eigenvalue {r} has positive real part.")
+    # If any root is unstable, fail loudly; only the first one can be
+    if calculated_roots[0].real > 1e-12:
+        raise ValueError(
+            f"Unstable system: eigenvalue {calculated_roots[0]} has positive real part."
+        )
 
-    # Exclude the near-zero open-circuit mode from tau selection
-    nonzero_roots = [
-        complex(r) for r in calculated_roots if abs(complex(r).real) > 1e-9
-    ]
+    # Slowest decay mode = first root clear of the near-zero open-circuit mode
+    for r in calculated_roots:
+        if r.real < -1e-9:
+            return -1 / r.real
 
     # If only the ~0 mode exists, the decay time is effectively infinite
-    if not nonzero_roots:
-        return float("inf")
-
-    # Slowest decay mode = real part closest to 0 (still negative)
-    dominant = max(nonzero_roots, key=lambda z: z.real)
-    decay_rate = -dominant.real
-
-    return 1 / decay_rate
+    return float("inf")
 
 
 def deactivation_two_tau(transducer: Transducer, rp: Optional[float] = None) -> float:
@@ -225,20 +262,172 @@ def deactivation_two_tau(transducer: Transducer, rp: Optional[float] = None) ->
     return 2 * deactivation_tau(transducer, rp)
 
 
+def deactivation_tau_batch(transducer: Transducer, rp: np.ndarray) -> np.ndarray:
+    """
+    Calculate the decay time (τ) for an array of parallel resistances in one call.
+
+    This is the vectorized counterpart of `deactivation_tau` for resistance sweeps.
+    The characteristic polynomials for all `rp` values are solved together with
+    the vectorized closed-form cubic solver, so no Python-level loop over `rp` is
+    required.
+
+    Parameters
+    ----------
+    transducer : Transducer
+        The transducer object containing the necessary circuit parameters.
+    rp : np.ndarray
+        Array of parallel resistances in ohms. All values must be positive.
+
+    Returns
+    -------
+    np.ndarray
+        Decay times (τ) in seconds, with the same shape as `rp`.
+
+    Raises
+    ------
+    ValueError
+        If any transducer parameter (rs, ls, cs, c0) is not positive, if any `rp`
+        is non-positive, or if the system is unstable for any `rp`.
+    """
+    # Validate input parameters
+    if (
+        transducer.rs <= 0
+        or transducer.ls <= 0
+        or transducer.cs <= 0
+        or transducer.c0 <= 0
+    ):
+        raise ValueError("All transducer parameters (rs, ls, cs, c0) must be positive.")
+
+    rp = np.asarray(rp, dtype=float)
+    if np.any(rp <= 0):
+        raise ValueError("All rp values must be positive.")
+
+    taus = _tau_batch_core(*transducer.as_tuple(), rp.ravel())
+
+    return taus.reshape(rp.shape)
+
+
+def deactivation_tau_transducers(
+    transducers: Sequence[Transducer], rp: Optional[float] = None
+) -> np.ndarray:
+    """
+    Calculate the decay time (τ) of several transducers for a common `rp` in one call.
+
+    The circuit parameters are gathered into one array per parameter, so the
+    characteristic polynomials of all transducers are solved together instead of
+    calling `deactivation_tau` in a loop.
+
+    Parameters
+    ----------
+    transducers : Sequence[Transducer]
+        The transducers to evaluate, e.g. ``list(predefined_transducers().values())``.
+    rp : Optional[float], default=None
+        Parallel resistance in ohms applied to every transducer. If None, the
+        decay time without rp (τ = 2 * ls / rs) is returned.
+
+    Returns
+    -------
+    np.ndarray
+        Decay times (τ) in seconds, one per transducer, in the given order.
+
+    Raises
+    ------
+    ValueError
+        If any transducer parameter (rs, ls, cs, c0) is not positive, if `rp` is
+        non-positive, or if the system is unstable for any transducer.
+    """
+    params = np.array([transducer.as_tuple() for transducer in transducers], float)
+    params = params.reshape(-1, 4)
+    if np.any(params <= 0):
+        raise ValueError("All transducer parameters (rs, ls, cs, c0) must be positive.")
+
+    rs, ls, cs, c0 = params.T
+    if rp is None:
+        return 2 * ls / rs
+    if rp <= 0:
+        raise ValueError("rp must be positive.")
+
+    return _tau_batch_core(rs, ls, cs, c0, np.full(len(params), float(rp)))
+
+
+def _tau_batch_core(
+    rs: Union[float, np.ndarray],
+    ls: Union[float, np.ndarray],
+    cs: Union[float, np.ndarray],
+    c0: Union[float, np.ndarray],
+    rp: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized decay time kernel for a 1-D array of finite, positive `rp` values.
+
+    The circuit parameters may be scalars or arrays of the same length as `rp`.
+
+    Counterpart of `_tau_core`: no parameter validation and no `Transducer`.
+    It calls the solver behind `roots_batch` directly, skipping that function's
+    validation and root sorting; the public callers (`deactivation_tau_batch`,
+    `deactivation_tau_transducers`, `optimum_resistance`) validate their inputs
+    once up front, and only the dominant real part is needed here.
+    """
+    # Characteristic polynomial coefficients, one row per rp value
+    a2 = rs / ls + 1.0 / (rp * c0)
+    a1 = rs / (rp * ls * c0) + 1.0 / (ls * cs) + 1.0 / (ls * c0)
+    a0 = 1.0 / (ls * cs * rp * c0)
+
+    # Roots of s^3 + a2*s^2 + a1*s + a0 = 0 for all rows at once
+    real_parts = _cubic_roots_batch(*np.broadcast_arrays(a2, a1, a0)).real
+
+    # If any root is unstable, fail loudly
+    if np.any(real_parts > 1e-12):
+        raise ValueError("Unstable system: eigenvalue has positive real part.")
+
+    # Slowest decay mode per row, excluding the near-zero open-circuit mode
+    dominant = np.where(np.abs(real_parts) > 1e-9, real_parts, -np.inf).max(axis=1)
+
+    return np.where(np.isfinite(dominant), -1.0 / dominant, np.inf)
+
+
 def optimum_resistance(
-    transducer: Transducer, resistance_range: Tuple[float, float] = (10, 10_000)
+    transducer: Transducer,
+    resistance_range: Tuple[float, float] = (10, 10_000),
+    xatol: float = 1e-3,
+    method: str = "bounded",
+    grid_points: int = 256,
 ) -> Tuple[float, float]:
-    """
+    r"""
     Calculate the optimal parallel resistance (highest damping)
     for the transient response in a transducer modeled by the
     Butterworth-Van Dyke (BVD) equivalent circuit using numerical optimization.
 
+    Three search strategies are available:
+
+    - ``"bounded"`` (default): bounded Brent minimization of the decay time. Fast
+      and accurate when the decay time has a single minimum within the range.
+    - ``"grid"``: evaluates the decay time on a logarithmic grid of `grid_points`
+      resistances in one vectorized call, then refines the best grid point with a
+      bounded search between its two neighbours. Robust against multiple local
+      minima within the range, at roughly twice the cost of ``"bounded"``.
+    - ``"analytic"``: starts from the closed-form estimate
+      :math:`R_p \approx 1 / (\omega_p C_0)`, with :math:`\omega_p` the parallel
+      resonance, and refines it with a bounded search on a narrow bracket around it.
+      Falls back to ``"grid"`` if the minimum is not inside that bracket.
+
     Parameters
     ----------
     transducer : Transducer
         The transducer object containing the necessary circuit parameters.
     resistance_range : Tuple[float, float], default=(10, 10,000)
         A tuple representing the lower and upper bounds for resistance (in ohms) to evaluate.
+    xatol : float, default=1e-3
+        Absolute tolerance on the optimal resistance, in ohms (not relative to Rp).
+        The decay time is flat around an interior minimum, so 1 mΩ saves evaluations
+        without noticeably changing it for typical optima of tens of ohms or more.
+        For ranges spanning only a few ohms, or an optimum at a bound close to 0 Ω,
+        this is coarse and the returned decay time can be noticeably off; pass a
+        smaller `xatol` there.
+    method : str, default="bounded"
+        Search strategy, one of ``"bounded"``, ``"grid"`` or ``"analytic"``.
+    grid_points : int, default=256
+        Number of logarithmically spaced resistances evaluated by the ``"grid"`` method.
 
     Returns
     -------
@@ -250,8 +439,8 @@ def optimum_resistance(
     Raises
     ------
     ValueError
-        If any transducer parameter (rs, ls, cs, c0) is not positive
-        or if resistance bounds are invalid.
+        If any transducer parameter (rs, ls, cs, c0) is not positive,
+        if resistance bounds are invalid, or if `method`/`grid_points` are invalid.
     """
     # Validate input parameters
     if (
@@ -269,61 +458,161 @@ def optimum_resistance(
             "Resistance range must have a lower bound less than the upper bound."
         )
 
+    if method not in ("bounded", "grid", "analytic"):
+        raise ValueError("method must be one of 'bounded', 'grid' or 'analytic'.")
+    if method in ("grid", "analytic") and grid_points < 2:
+        raise ValueError("grid_points must be at least 2.")
+
+    if method == "grid":
+        optimal_resistance, minimal_decay_time = _optimum_resistance_grid(
+            *transducer.as_tuple(), resistance_range, xatol, grid_points
+        )
+    elif method == "analytic":
+        optimal_resistance, minimal_decay_time = _optimum_resistance_analytic(
+            *transducer.as_tuple(), resistance_range, xatol, grid_points
+        )
+    else:
+        optimal_resistance, minimal_decay_time = _optimum_resistance_bounded(
+            *transducer.as_tuple(), resistance_range, xatol
+        )
+
+    # Check if the optimal resistance is near the bounds
+    if logging.getLogger().isEnabledFor(logging.WARNING):
+        lower_bound, upper_bound = resistance_range
+        tolerance = 0.01 * (upper_bound - lower_bound)  # 1% of the range
+        if abs(optimal_resistance - lower_bound) < tolerance:
+            logging.warning(
+                "Hint: The optimal resistance (%.2f Ω) is near the lower bound of the range. "
+                "Consider reducing the lower bound.",
+                optimal_resistance,
+            )
+        elif abs(optimal_resistance - upper_bound) < tolerance:
+            logging.warning(
+                "Hint: The optimal resistance (%.2f Ω) is near the upper bound of the range. "
+                "Consider increasing the upper bound.",
+                optimal_resistance,
+            )
+
+    return optimal_resistance, minimal_decay_time
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _optimum_resistance_grid(
+    rs: float,
+    ls: float,
+    cs: float,
+    c0: float,
+    resistance_range: Tuple[float, float],
+    xatol: float,
+    grid_points: int,
+) -> Tuple[float, float]:
+    """
+    Vectorized grid search over `resistance_range`, polished by a bounded search
+    on the bracket formed by the neighbours of the best grid point.
+    """
+    rp_grid = np.geomspace(resistance_range[0], resistance_range[1], grid_points)
+    taus = _tau_batch_core(rs, ls, cs, c0, rp_grid)
+    best = int(np.argmin(taus))
+
+    bracket = (rp_grid[max(best - 1, 0)], rp_grid[min(best + 1, grid_points - 1)])
+    rp_polished, tau_polished = _optimum_resistance_bounded(
+        rs, ls, cs, c0, bracket, xatol
+    )
+
+    # Keep the grid point if the polish did not improve on it (e.g. flat minimum)
+    if tau_polished <= taus[best]:
+        return rp_polished, tau_polished
+    return float(rp_grid[best]), float(taus[best])
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _optimum_resistance_analytic(
+    rs: float,
+    ls: float,
+    cs: float,
+    c0: float,
+    resistance_range: Tuple[float, float],
+    xatol: float,
+    grid_points: int,
+) -> Tuple[float, float]:
+    """
+    Bounded search on a narrow bracket around the estimate Rp = 1 / (w_p * C0).
+
+    For weak series damping the slowest mode decays fastest when the parallel
+    branch Rp || C0 has its corner frequency at the parallel resonance
+    w_p = sqrt((Cs + C0) / (Ls * Cs * C0)); the true optimum lies within a few
+    percent of it. If the minimum is not inside the bracket (heavy series
+    damping, C0 much smaller than Cs, ...), the estimate does not apply and the
+    grid search is used instead.
+    """
+    lower_bound, upper_bound = resistance_range
+    # 1 / (w_p * C0) with w_p = sqrt((Cs + C0) / (Ls * Cs * C0))
+    estimate = math.sqrt(ls * cs / (c0 * (cs + c0)))
+    estimate = min(max(estimate, lower_bound), upper_bound)
+
+    bracket = (max(estimate / 1.25, lower_bound), min(estimate * 1.25, upper_bound))
+    rp_opt, tau_opt = _optimum_resistance_bounded(rs, ls, cs, c0, bracket, xatol)
+
+    # Brent stops about sqrt(eps)*|x| + xatol/3 short of a bound, so the edge
+    # test scales with Rp. An inner edge that is at least as good as the refined
+    # point means the minimum lies outside the bracket; use the grid search then.
+    # A bracket edge on the range bound itself is returned if it is better.
+    for edge in bracket:
+        tau_edge = _tau_core(rs, ls, cs, c0, edge)
+        if lower_bound < edge < upper_bound:
+            if tau_edge <= tau_opt or abs(rp_opt - edge) < 10 * xatol + 1e-6 * edge:
+                return _optimum_resistance_grid(
+                    rs, ls, cs, c0, resistance_range, xatol, grid_points
+                )
+        elif tau_edge < tau_opt:
+            rp_opt, tau_opt = float(edge), tau_edge
+    return rp_opt, tau_opt
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _optimum_resistance_bounded(
+    rs: float,
+    ls: float,
+    cs: float,
+    c0: float,
+    resistance_range: Tuple[float, float],
+    xatol: float,
+) -> Tuple[float, float]:
+    """
+    Bounded Brent minimization of the decay time over `resistance_range`.
+    """
+
     def decay_time_wrapper(rp: float) -> float:
         """
-        Wrapper for decay_time to match the signature for optimization.
+        Wrapper for the decay time kernel to match the signature for optimization.
         """
-        return deactivation_tau(transducer, rp=rp)
+        return _tau_core(rs, ls, cs, c0, rp)
+
+    # scipy.optimize dominates the package import time, so it is only loaded
+    # once an optimization is actually requested.
+    # pylint: disable-next=import-outside-toplevel
+    from scipy.optimize import minimize_scalar
 
     # Perform numerical optimization to find the resistance that minimizes decay time
     result = minimize_scalar(
         decay_time_wrapper,
         bounds=resistance_range,
         method="bounded",  # Use bounded optimization since we have a range
+        options={"xatol": xatol},
     )
 
-    # Extract optimal resistance and corresponding decay time
-    optimal_resistance = result.x
-    minimal_decay_time = result.fun
-
-    # Check if the optimal resistance is near the bounds
-    lower_bound, upper_bound = resistance_range
-    tolerance = 0.01 * (upper_bound - lower_bound)  # 1% of the range
-    if abs(optimal_resistance - lower_bound) < tolerance:
-        logging.warning(
-            "Hint: The optimal resistance (%.2f Ω) is near the lower bound of the range. "
-            "Consider reducing the lower bound.",
-            optimal_resistance,
-        )
-        print(
-            "Hint: The optimal resistance (%.2f Ω) is near the lower bound of the range. "
-            "Consider reducing the lower bound.",
-            optimal_resistance,
-        )
-    elif abs(optimal_resistance - upper_bound) < tolerance:
-        logging.warning(
-            "Hint: The optimal resistance (%.2f Ω) is near the upper bound of the range. "
-            "Consider increasing the upper bound.",
-            optimal_resistance,
-        )
-        print(
-            "Hint: The optimal resistance (%.2f Ω) is near the upper bound of the range. "
-            "Consider increasing the upper bound.",
-            optimal_resistance,
-        )
-
-    return optimal_resistance, minimal_decay_time
+    return float(result.x), float(result.fun)
 
 
 # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
 def deactivation_current(
-    t: float,
+    t: Union[float, np.ndarray],
     i0: float,
     transducer: Transducer,
     rp: Optional[float] = None,
     di0: float = 0.0,
     d2i0: Optional[float] = None,
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate the transient current i(t) for the deactivation case (MOSFET opens).
 
@@ -338,8 +627,9 @@ def deactivation_current(
 
     Parameters
     ----------
-    t : float
-        Time in seconds.
+    t : float or np.ndarray
+        Time in seconds. If an array is provided, the current is evaluated for all
+        time points at once; the eigenvalues and coefficients are computed only once.
     i0 : float
         Initial current i(0) in ampere.
     transducer : Transducer
@@ -354,53 +644,121 @@ def deactivation_current(
 
     Returns
     -------
-    float
-        Current i(t).
+    float or np.ndarray
+        Current i(t). An array of the same shape is returned if `t` is an array.
+    """
+    return deactivation_waveform(i0, transducer, rp=rp, di0=di0, d2i0=d2i0)(t)
+
+
+def deactivation_waveform(
+    i0: float,
+    transducer: Transducer,
+    rp: Optional[float] = None,
+    di0: float = 0.0,
+    d2i0: Optional[float] = None,
+) -> Callable[[Union[float, np.ndarray]], Union[float, np.ndarray]]:
+    """
+    Prepare the deactivation transient i(t) for repeated evaluation.
+
+    Solves for the eigenvalues and modal coefficients once and returns a function
+    of time only. Calling the result with `t` gives the same values as
+    ``deactivation_current(t, i0, transducer, rp, di0, d2i0)``, so it is the
+    cheaper choice when the same transient is evaluated many times, e.g. at
+    scalar time points inside a loop.
+
+    Parameters
+    ----------
+    i0 : float
+        Initial current i(0) in ampere.
+    transducer : Transducer
+        Transducer parameters.
+    rp : Optional[float]
+        Parallel damping resistance. If None, uses transducer.rp. If still None,
+        open circuit is assumed.
+    di0 : float
+        Initial derivative i'(0) in A/s.
+    d2i0 : Optional[float]
+        Initial second derivative i''(0) in A/s^2. Inferred as in
+        `deactivation_current` if not provided.
+
+    Returns
+    -------
+    Callable[[float or np.ndarray], float or np.ndarray]
+        Function mapping time in seconds (scalar or array) to the current i(t).
     """
     # Use transducer's rp if not explicitly provided
     rp = transducer.rp if rp is None else rp
 
     # MOSFET open => open circuit
     if rp is None:
-        rp = np.inf
+        rp = math.inf
 
-    eigenvalues = roots(
-        transducer.rs, transducer.ls, transducer.cs, transducer.c0, rp=rp
-    )
+    # Python complex values, sorted by real part (descending)
+    eigenvalues = roots(*transducer.as_tuple(), rp=rp)
 
-    # Stability check (allow tiny numerical noise)
-    for lam in eigenvalues:
-        if complex(lam).real > 1e-12:
-            raise ValueError(
-                f"Unstable system: eigenvalue {lam} has positive real part."
-            )
+    # Stability check (allow tiny numerical noise); only the first root can fail
+    if eigenvalues[0].real > 1e-12:
+        raise ValueError(
+            f"Unstable system: eigenvalue {eigenvalues[0]} has positive real part."
+        )
 
     # If user did not provide i''(0), infer it from the dominant oscillatory eigenpair
     if d2i0 is None:
-        lam_osc = max((complex(z) for z in eigenvalues), key=lambda z: abs(z.imag))
-        omega_d = abs(lam_osc.imag)
+        omega_d = max(abs(z.imag) for z in eigenvalues)
         d2i0 = -(omega_d**2) * i0 if omega_d > 0 else 0.0
 
-    lam1_c, lam2_c, lam3_c = map(complex, eigenvalues)
-
-    # Solve for coef_a, coef_b, coef_c from:
-    # i(0)  = coef_a + coef_b + coef_c = i0
-    # i'(0) = lam1*coef_a + lam2*coef_b + lam3*coef_c = di0
-    # i''(0)= lam1^2*coef_a + lam2^2*coef_b + lam3^2*coef_c = d2i0
-    matrix = np.array(
-        [
-            [1.0, 1.0, 1.0],
-            [lam1_c, lam2_c, lam3_c],
-            [lam1_c**2, lam2_c**2, lam3_c**2],
-        ],
-        dtype=complex,
-    )
-    rhs = np.array([i0, di0, d2i0], dtype=complex)
-    coef_a, coef_b, coef_c = np.linalg.solve(matrix, rhs)
+    lam1_c, lam2_c, lam3_c = eigenvalues
+    coef_a, coef_b, coef_c = _mode_coefficients(lam1_c, lam2_c, lam3_c, i0, di0, d2i0)
+
+    lams = np.array([lam1_c, lam2_c, lam3_c])
+    coefs = np.array([coef_a, coef_b, coef_c])
 
-    i_t = (
-        coef_a * cmath.exp(lam1_c * t)
-        + coef_b * cmath.exp(lam2_c * t)
-        + coef_c * cmath.exp(lam3_c * t)
+    def current(t: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Current i(t) in ampere at time `t` in seconds.
+        """
+        if np.ndim(t) > 0:
+            # i(t) = sum_k c_k * exp(lam_k * t), evaluated for all t at once
+            modes = np.exp(np.multiply.outer(np.asarray(t, dtype=float), lams))
+            return (modes @ coefs).real
+
+        i_t = (
+            coef_a * cmath.exp(lam1_c * t)
+            + coef_b * cmath.exp(lam2_c * t)
+            + coef_c * cmath.exp(lam3_c * t)
+        )
+        return float(i_t.real)
+
+    return current
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _mode_coefficients(
+    lam1: complex,
+    lam2: complex,
+    lam3: complex,
+    i0: float,
+    di0: float,
+    d2i0: float,
+) -> Tuple[complex, complex, complex]:
+    """
+    Solve the 3x3 Vandermonde system for the modal coefficients in closed form.
+
+    The coefficients satisfy:
+    i(0)  = c1 + c2 + c3 = i0
+    i'(0) = lam1*c1 + lam2*c2 + lam3*c3 = di0
+    i''(0)= lam1^2*c1 + lam2^2*c2 + lam3^2*c3 = d2i0
+
+    Each c_k follows from Lagrange interpolation on the eigenvalues, which avoids
+    a general-purpose linear solve for this fixed-size system.
+    """
+    coef_1 = (d2i0 - (lam2 + lam3) * di0 + lam2 * lam3 * i0) / (
+        (lam1 - lam2) * (lam1 - lam3)
+    )
+    coef_2 = (d2i0 - (lam1 + lam3) * di0 + lam1 * lam3 * i0) / (
+        (lam2 - lam1) * (lam2 - lam3)
+    )
+    coef_3 = (d2i0 - (lam1 + lam2) * di0 + lam1 * lam2 * i0) / (
+        (lam3 - lam1) * (lam3 - lam2)
     )
-    return float(i_t.real)
+    return coef_1, coef_2, coef_3
@@ -6,20 +6,25 @@ transducer with predefined parameters. The transducer stores electrical circuit
 parameters and additional metadata such as the manufacturer and resonance frequency.
 """
 
+import functools
 import json
 import math
 import os
 from dataclasses import dataclass
+from types import MappingProxyType
 from importlib import resources
 from pathlib import Path
-from typing import Dict, Optional, Any, Mapping, Union
+from typing import Dict, Optional, Any, Mapping, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Transducer:
     """
     Represents an ultrasound transducer described by a BVD equivalent circuit.
 
+    Instances use ``__slots__``, so attribute access avoids a per-instance
+    ``__dict__`` lookup and each object stays small.
+
     Parameters
     ----------
     rs : float
@@ -84,6 +89,42 @@ class Transducer:
         """
         return 1 / (2 * math.pi * (self.ls * self.cs) ** 0.5)
 
+    @property
+    def angular_frequency(self) -> float:
+        """
+        Compute the angular resonance frequency dynamically.
+
+        Returns
+        -------
+        float
+            Angular resonance frequency ω_r = 1 / sqrt(Ls * Cs) in rad/s.
+        """
+        return 1 / math.sqrt(self.ls * self.cs)
+
+    @property
+    def tau_no_rp(self) -> float:
+        """
+        Compute the decay time constant of the series branch without a parallel resistor.
+
+        Returns
+        -------
+        float
+            Decay time τ = 2 * Ls / Rs in seconds.
+        """
+        return 2 * self.ls / self.rs
+
+    def as_tuple(self) -> Tuple[float, float, float, float]:
+        """
+        Return the series-branch and parallel capacitance parameters as plain floats.
+
+        Returns
+        -------
+        Tuple[float, float, float, float]
+            ``(rs, ls, cs, c0)``, in the argument order used by the numerical
+            kernels (e.g. `roots`).
+        """
+        return self.rs, self.ls, self.cs, self.c0
+
     def set_name(self, name: str) -> "Transducer":
         """
         Set the transducer's name.
@@ -180,35 +221,82 @@ def _load_transducer_db_json(json_file: Optional[JsonPath] = None) -> Mapping[st
 
     This works for normal installs and wheels because it uses importlib.resources
     for the bundled default.
+
+    Parsed databases are cached, so repeated lookups (e.g. `select_transducer` in a
+    loop) do not re-read and re-parse the JSON. Files on disk are keyed by their
+    modification time, size and inode, so edits are picked up on the next call.
+    The cached database is returned as a read-only mapping.
     """
     # 1) explicit path wins
     if json_file is not None:
-        json_path = Path(json_file)
-        with json_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_transducer_db_file(Path(json_file))
 
     # 2) environment override
     env_path = os.environ.get(TRANSDUCERS_ENV_VAR)
     if env_path:
-        json_path = Path(env_path)
-        with json_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_transducer_db_file(Path(env_path))
 
     # 3) bundled default (package data)
+    return _read_bundled_transducer_db()
+
+
+def _read_transducer_db_file(json_path: Path) -> Mapping[str, Any]:
+    """
+    Read a transducer database file from disk through the parse cache.
+    """
+    stat = json_path.stat()
+    # The size and inode catch rewrites within the filesystem's mtime granularity
+    return _parse_transducer_db_file(
+        str(json_path.resolve()), (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_transducer_db_file(
+    json_path: str, _file_version: Tuple[int, int, int]
+) -> Mapping[str, Any]:
+    """
+    Parse a transducer database file. Cached per (path, mtime, size, inode).
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        return _read_only_db(json.load(f))
+
+
+@functools.lru_cache(maxsize=1)
+def _read_bundled_transducer_db() -> Mapping[str, Any]:
+    """
+    Parse the bundled default transducer database. Cached for the process lifetime.
+    """
     # Note: resources.files(...) is available in Python 3.9+
     resource = resources.files("transientbvd").joinpath(DEFAULT_TRANSDUCERS_RESOURCE)
     with resource.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        return _read_only_db(json.load(f))
+
+
+def _read_only_db(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Wrap a parsed database (and its per-transducer entries) in read-only views, so
+    callers cannot modify the cached copy.
+    """
+    return MappingProxyType(
+        {
+            name: MappingProxyType(params) if isinstance(params, dict) else params
+            for name, params in data.items()
+        }
+    )
 
 
-def load_transducers(json_file: Optional[JsonPath] = None) -> Dict[str, Transducer]:
+def load_transducers(
+    json_file: Optional[Union[JsonPath, Mapping[str, Any]]] = None,
+) -> Dict[str, Transducer]:
     """
     Load transducer data and create Transducer objects.
 
     Parameters
     ----------
-    json_file : Optional[Union[str, Path]]
-        Path to a JSON file. If None:
+    json_file : Optional[Union[str, Path, Mapping[str, Any]]]
+        Path to a JSON file, or an already parsed database mapping (same layout as
+        the JSON file), which skips reading and parsing entirely. If None:
         - will try env var TRANSIENTBVD_TRANSDUCERS_JSON
         - otherwise loads the bundled default database.
 
@@ -217,7 +305,10 @@ def load_transducers(json_file: Optional[JsonPath] = None) -> Dict[str, Transduc
     Dict[str, Transducer]
         Dictionary keyed by transducer name.
     """
-    data = _load_transducer_db_json(json_file=json_file)
+    if isinstance(json_file, Mapping):
+        data = json_file
+    else:
+        data = _load_transducer_db_json(json_file=json_file)
 
     transducers: Dict[str, Transducer] = {}
     for name, params in data.items():
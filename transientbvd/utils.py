@@ -8,8 +8,9 @@ Functions include resonance frequency calculation, polynomial root solving,
 and other numerical methods used throughout the TransientBVD package.
 """
 
+import math
 from typing import List
-from typing import overload, Optional
+from typing import overload, Optional, Union
 
 import numpy as np
 
@@ -63,7 +64,38 @@ def resonance_frequency(
         raise ValueError("Both 'ls' and 'cs' must be positive.")
 
     # Calculate and return resonance frequency
-    return 1 / (2 * np.pi * (ls * cs) ** 0.5)
+    return 1 / (2 * math.pi * math.sqrt(ls * cs))
+
+
+def resonance_frequency_batch(
+    ls: Union[float, np.ndarray], cs: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Vectorized counterpart of `resonance_frequency` for many parameter sets at once.
+
+    Parameters
+    ----------
+    ls : float or np.ndarray
+        Motional inductance in henries. Must be positive.
+    cs : float or np.ndarray
+        Motional capacitance in farads. Must be positive.
+
+    Returns
+    -------
+    np.ndarray
+        Resonance frequencies in hertz, with the broadcast shape of `ls` and `cs`.
+
+    Raises
+    ------
+    ValueError
+        If any entry of `ls` or `cs` is non-positive.
+    """
+    ls = np.asarray(ls, dtype=float)
+    cs = np.asarray(cs, dtype=float)
+    if np.any(ls <= 0) or np.any(cs <= 0):
+        raise ValueError("Both 'ls' and 'cs' must be positive.")
+
+    return 1 / (2 * np.pi * np.sqrt(ls * cs))
 
 
 @overload
@@ -112,27 +144,257 @@ def roots(
 
     # Normalize semantics: "no Rp" means open circuit (MOSFET open) => Rp -> ∞
     if rp is None:
-        rp = np.inf
-
-    if np.isfinite(rp):
-        if rp <= 0:
-            raise ValueError("If provided, rp must be a positive value.")
-        # With finite parallel resistance Rp
-        a2 = rs / ls + 1.0 / (rp * c0)
-        a1 = rs / (rp * ls * c0) + 1.0 / (ls * cs) + 1.0 / (ls * c0)
-        a0 = 1.0 / (ls * cs * rp * c0)
-    else:
-        # Open circuit Rp -> ∞ (MOSFET opens)
-        a2 = rs / ls
-        a1 = 1.0 / (ls * cs) + 1.0 / (ls * c0)
-        a0 = 0.0
+        rp = math.inf
+
+    if rp <= 0:
+        raise ValueError("If provided, rp must be a positive value.")
+
+    return _roots_core(rs, ls, cs, c0, rp)
+
+
+def _roots_core(rs: float, ls: float, cs: float, c0: float, rp: float) -> List[complex]:
+    """
+    Unvalidated numerical core of `roots`.
+
+    Expects positive floats and `rp` either finite and positive or `math.inf`
+    (open circuit). Callers that validated their inputs already (e.g. inside an
+    optimization loop) use this directly to skip the checks.
+    """
+    # Shared subexpressions of the coefficients
+    damping = rs / ls
+    w_s2 = 1.0 / (ls * cs)
+    # 1 / (Rp*C0); exactly 0 for the open circuit Rp -> ∞ (MOSFET opens)
+    g0 = 1.0 / (rp * c0)
 
-    # Solve cubic numerically: s^3 + a2*s^2 + a1*s + a0 = 0
-    coeff = np.array([1.0, a2, a1, a0], dtype=float)
-    rts = np.roots(coeff)
+    a2 = damping + g0
+    a1 = damping * g0 + w_s2 + 1.0 / (ls * c0)
+    a0 = w_s2 * g0
+
+    # Solve cubic analytically: s^3 + a2*s^2 + a1*s + a0 = 0
+    rts = _cubic_roots(a2, a1, a0)
 
     # Deterministic ordering helps downstream code (tau selection, debugging)
-    rts_sorted = sorted(
-        (complex(x) for x in rts), key=lambda z: (z.real, z.imag), reverse=True
-    )
+    rts_sorted = sorted(rts, key=lambda z: (z.real, z.imag), reverse=True)
     return rts_sorted
+
+
+def _cubic_roots(a2: float, a1: float, a0: float) -> List[complex]:
+    """
+    Roots of the monic cubic s^3 + a2*s^2 + a1*s + a0 = 0 with real coefficients.
+
+    A real root is obtained in closed form (Cardano, or the trigonometric form when
+    all three roots are real), refined with Newton steps and deflated; the remaining
+    quadratic is solved with the cancellation-free formula. For such a small
+    polynomial this is much cheaper than the companion-matrix eigenvalue solve of
+    `np.roots`.
+
+    The BVD coefficients span many orders of magnitude (a2 ~ Rs/Ls, a1 ~ 1/(Ls*Cs),
+    a0 ~ a1/(Rp*C0)), so the variable is first rescaled as s = w*x with w a power
+    of two bounding the root magnitudes. The scaled cubic has coefficients of order
+    one, which keeps intermediate powers like q**3 far from overflow, and the
+    power-of-two scaling itself introduces no rounding error.
+    """
+    scale = _root_scale(a2, a1, a0)
+    scaled = _cubic_roots_unit(a2 / scale, a1 / scale**2, a0 / scale**3)
+    return [scale * z for z in scaled]
+
+
+def _root_scale(a2: float, a1: float, a0: float) -> float:
+    """
+    Power of two close to the root magnitude bound max(|a2|, |a1|^(1/2), |a0|^(1/3)).
+    """
+    bound = max(abs(a2), math.sqrt(abs(a1)), abs(a0) ** (1.0 / 3.0))
+    return math.ldexp(1.0, math.frexp(bound)[1])
+
+
+def _cubic_roots_unit(a2: float, a1: float, a0: float) -> List[complex]:
+    """
+    Cubic solver behind `_cubic_roots`, for coefficients already scaled to order one.
+    """
+    if a0 == 0.0:
+        # s = 0 is an exact root (open circuit), the rest is s^2 + a2*s + a1
+        return [0j, *_quadratic_roots(a2, a1)]
+
+    # Numerical Recipes form of Cardano's method
+    q = (a2 * a2 - 3.0 * a1) / 9.0
+    r = (2.0 * a2 * a2 * a2 - 9.0 * a2 * a1 + 27.0 * a0) / 54.0
+    if r * r < q * q * q:
+        # Three real roots; take the one of largest magnitude for stable deflation
+        theta = math.acos(r / math.sqrt(q * q * q))
+        candidates = [
+            -2.0 * math.sqrt(q) * math.cos((theta + k * 2.0 * math.pi) / 3.0) - a2 / 3.0
+            for k in range(3)
+        ]
+        s1 = max(candidates, key=abs)
+    else:
+        big_a = -math.copysign(
+            (abs(r) + math.sqrt(r * r - q * q * q)) ** (1.0 / 3.0), r
+        )
+        big_b = q / big_a if big_a != 0.0 else 0.0
+        s1 = (big_a + big_b) - a2 / 3.0
+
+    # Newton refinement on the original polynomial removes the cancellation
+    # introduced by the shift -a2/3
+    for _ in range(2):
+        f = ((s1 + a2) * s1 + a1) * s1 + a0
+        df = (3.0 * s1 + 2.0 * a2) * s1 + a1
+        if df == 0.0:
+            break
+        s1 -= f / df
+
+    # Deflate: s^3 + a2*s^2 + a1*s + a0 = (s - s1) * (s^2 + e1*s + e0)
+    e1 = a2 + s1
+    e0 = -a0 / s1 if s1 != 0.0 else a1
+    return [complex(s1), *_quadratic_roots(e1, e0)]
+
+
+def _quadratic_roots(b: float, c: float) -> List[complex]:
+    """
+    Roots of the monic quadratic s^2 + b*s + c = 0 with real coefficients.
+    """
+    disc = b * b - 4.0 * c
+    if disc < 0.0:
+        half_im = 0.5 * math.sqrt(-disc)
+        return [complex(-0.5 * b, half_im), complex(-0.5 * b, -half_im)]
+
+    # Avoid subtracting nearly equal numbers for the smaller root
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    if q == 0.0:
+        return [0j, 0j]
+    return [complex(q), complex(c / q)]
+
+
+def roots_batch(
+    rs: Union[float, np.ndarray],
+    ls: Union[float, np.ndarray],
+    cs: Union[float, np.ndarray],
+    c0: Union[float, np.ndarray],
+    rp: Optional[Union[float, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Vectorized counterpart of `roots` for many parameter sets at once.
+
+    All arguments are broadcast against each other. `rp` follows the same
+    termination semantics as in `roots`: None or `np.inf` entries mean open circuit.
+
+    Parameters
+    ----------
+    rs, ls, cs, c0 : float or np.ndarray
+        BVD model parameters. Must be positive.
+    rp : float or np.ndarray, optional
+        Parallel resistance in ohms. Finite entries must be positive.
+
+    Returns
+    -------
+    np.ndarray
+        Complex array of shape ``broadcast_shape + (3,)``. The roots of each
+        parameter set are ordered like in `roots` (by real part, then imaginary
+        part, descending).
+
+    Raises
+    ------
+    ValueError
+        If any parameter is non-positive.
+    """
+    rp = math.inf if rp is None else rp
+    rs, ls, cs, c0, rp = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (rs, ls, cs, c0, rp))
+    )
+    if np.any(rs <= 0) or np.any(ls <= 0) or np.any(cs <= 0) or np.any(c0 <= 0):
+        raise ValueError("All BVD model parameters (rs, ls, cs, c0) must be positive.")
+    if np.any(rp <= 0):
+        raise ValueError("If provided, rp must be a positive value.")
+
+    shape = rs.shape
+    rs, ls, cs, c0, rp = (x.ravel() for x in (rs, ls, cs, c0, rp))
+
+    # 1 / rp is exactly 0 for the open circuit, which reproduces its coefficients
+    g0 = 1.0 / (rp * c0)
+    a2 = rs / ls + g0
+    a1 = rs / ls * g0 + 1.0 / (ls * cs) + 1.0 / (ls * c0)
+    a0 = g0 / (ls * cs)
+
+    rts = _cubic_roots_batch(a2, a1, a0)
+
+    # NumPy orders complex values by real part, then imaginary part
+    return np.sort(rts, axis=-1)[:, ::-1].reshape(shape + (3,))
+
+
+def _cubic_roots_batch(a2: np.ndarray, a1: np.ndarray, a0: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `_cubic_roots` for 1-D coefficient arrays: same algorithm, with
+    the branches resolved by `np.where`. Returns an array of shape ``(n, 3)``.
+    """
+    # Rescale to order-one coefficients, see `_cubic_roots`
+    bound = np.maximum.reduce([np.abs(a2), np.sqrt(np.abs(a1)), np.cbrt(np.abs(a0))])
+    scale = np.ldexp(1.0, np.frexp(bound)[1])
+    a2, a1, a0 = a2 / scale, a1 / scale**2, a0 / scale**3
+
+    s1 = _real_cubic_root_batch(a2, a1, a0)
+
+    # Deflate: s^3 + a2*s^2 + a1*s + a0 = (s - s1) * (s^2 + e1*s + e0)
+    e1 = a2 + s1
+    e0 = np.divide(-a0, s1, out=a1.copy(), where=s1 != 0.0)
+
+    return scale[:, None] * np.column_stack([s1 + 0j, _quadratic_roots_batch(e1, e0)])
+
+
+def _real_cubic_root_batch(
+    a2: np.ndarray, a1: np.ndarray, a0: np.ndarray
+) -> np.ndarray:
+    """
+    One real root per row of s^3 + a2*s^2 + a1*s + a0 = 0, Newton-refined.
+    """
+    q = (a2 * a2 - 3.0 * a1) / 9.0
+    r = (2.0 * a2 * a2 * a2 - 9.0 * a2 * a1 + 27.0 * a0) / 54.0
+    q3 = q * q * q
+
+    # np.where evaluates both branches; each is only valid where it is selected
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Three real roots: the one of largest magnitude, for stable deflation
+        theta = np.arccos(np.clip(r / np.sqrt(q3), -1.0, 1.0))
+        candidates = (
+            -2.0
+            * np.sqrt(q)[:, None]
+            * np.cos((theta[:, None] + np.arange(3) * 2.0 * np.pi) / 3.0)
+            - (a2 / 3.0)[:, None]
+        )
+        s_trig = candidates[np.arange(len(a2)), np.argmax(np.abs(candidates), axis=1)]
+
+        # One real root: Cardano
+        big_a = -np.copysign(np.cbrt(np.abs(r) + np.sqrt(r * r - q3)), r)
+        s_cardano = (big_a + np.where(big_a != 0.0, q / big_a, 0.0)) - a2 / 3.0
+
+    # s = 0 is an exact root for the open circuit (a0 = 0)
+    open_circuit = a0 == 0.0
+    s1 = np.where(open_circuit, 0.0, np.where(r * r < q3, s_trig, s_cardano))
+
+    for _ in range(2):
+        df = (3.0 * s1 + 2.0 * a2) * s1 + a1
+        step = np.divide(
+            ((s1 + a2) * s1 + a1) * s1 + a0,
+            df,
+            out=np.zeros_like(df),
+            where=df != 0.0,
+        )
+        s1 = np.where(open_circuit, 0.0, s1 - step)
+
+    return s1
+
+
+def _quadratic_roots_batch(b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `_quadratic_roots`. Returns an array of shape ``(n, 2)``.
+    """
+    disc = b * b - 4.0 * c
+    sqrt_disc = np.sqrt(np.abs(disc))
+    complex_pair = disc < 0.0
+
+    big_q = -0.5 * (b + np.copysign(sqrt_disc, b))
+    small = np.divide(c, big_q, out=np.zeros_like(big_q), where=big_q != 0.0)
+    return np.column_stack(
+        [
+            np.where(complex_pair, -0.5 * b + 0.5j * sqrt_disc, big_q),
+            np.where(complex_pair, -0.5 * b - 0.5j * sqrt_disc, small),
+        ]
+    )